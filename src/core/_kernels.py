@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数值热点内核 - 帧校验和与0x33偏置去除
+优先使用Numba JIT编译为本地循环；未安装Numba时回退到NumPy向量化实现
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True)
+    def checksum_u8(buf):
+        """uint8缓冲区求和校验 (模256)"""
+        # Numba算术会把uint8提升为int64，需显式掩码保持模256
+        s = 0
+        for i in range(buf.shape[0]):
+            s = (s + buf[i]) & 0xFF
+        return s
+
+    @njit(cache=True, nogil=True)
+    def deoffset_u8(buf, out):
+        """逐字节去除0x33偏置 (模256自动回绕)"""
+        for i in range(buf.shape[0]):
+            out[i] = buf[i] - np.uint8(0x33)
+
+    @njit(cache=True, nogil=True)
+    def encode_values_le(values, scale, nbytes, min_v, max_v, out):
+        """缩放-取整-范围检查-小端打包一体化内核
+
+        values: float64[:], out: uint8[:, :] (N x nbytes)
+        返回首个越界元素的索引，全部在范围内返回-1
+        """
+        for i in range(values.shape[0]):
+            s = np.int64(np.rint(values[i] * scale))
+            if s < min_v or s > max_v:
+                return i
+            for b in range(nbytes):
+                out[i, b] = (s >> (8 * b)) & 0xFF
+        return -1
+else:
+    def checksum_u8(buf):
+        """uint8缓冲区求和校验 (模256自动回绕)"""
+        return buf.sum(dtype=np.uint8)
+
+    def deoffset_u8(buf, out):
+        """逐字节去除0x33偏置 (模256自动回绕)"""
+        np.subtract(buf, np.uint8(0x33), out=out)
+
+    def encode_values_le(values, scale, nbytes, min_v, max_v, out):
+        """缩放-取整-范围检查-小端打包 (NumPy向量化回退实现)
+
+        values: float64[:], out: uint8[:, :] (N x nbytes)
+        返回首个越界元素的索引，全部在范围内返回-1
+        """
+        scaled = np.rint(values * scale).astype(np.int64)
+        out_of_range = (scaled < min_v) | (scaled > max_v)
+        if out_of_range.any():
+            return int(np.argmax(out_of_range))
+        for b in range(nbytes):
+            out[:, b] = (scaled >> (8 * b)) & 0xFF
+        return -1
+
+
+def frame_checksum(data: bytes, count: int = -1, offset: int = 0) -> int:
+    """计算帧校验和: data[offset:offset+count]的uint8累加和"""
+    buf = np.frombuffer(data, dtype=np.uint8, count=count, offset=offset)
+    return int(checksum_u8(buf))
+
+
+def deoffset_bytes(data: bytes) -> bytes:
+    """去除0x33偏置，返回新的bytes"""
+    buf = np.frombuffer(data, dtype=np.uint8)
+    out = np.empty(len(data), dtype=np.uint8)
+    deoffset_u8(buf, out)
+    return out.tobytes()
+
+
+# 导入时用1元素缓冲区预热编译，避免首次调用承担JIT开销
+_warm = np.zeros(1, dtype=np.uint8)
+checksum_u8(_warm)
+deoffset_u8(_warm, np.empty(1, dtype=np.uint8))
+encode_values_le(np.zeros(1, dtype=np.float64), 1.0, 1, 0, 255,
+                 np.empty((1, 1), dtype=np.uint8))
+del _warm
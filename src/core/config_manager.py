@@ -120,10 +120,11 @@ class ConfigManager:
                     # 立即保存迁移后的配置
                     self.save_config()
             else:
-                # 配置文件不存在，创建默认配置
-                self.logger.info("配置文件不存在，创建默认配置")
+                # 配置文件不存在：直接用内存默认值，不落盘。
+                # 默认配置完全由AppConfig字段定义，首次保存推迟到
+                # 用户实际修改时，构造路径不产生任何磁盘写
+                self.logger.info("配置文件不存在，使用默认配置")
                 self.current_config = AppConfig()
-                self.save_config()
 
         except Exception as e:
             self.logger.error(f"配置加载失败: {e}")
@@ -148,10 +149,12 @@ class ConfigManager:
             if self.config_file.exists():
                 self._create_backup()
 
-            # 保存配置
+            # 先写临时文件再os.replace原子替换，崩溃不会留下半截配置
             config_dict = asdict(self.current_config)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.config_file)
 
             self.logger.info(f"配置保存成功: {self.config_file}")
             return True
@@ -317,6 +320,9 @@ class ConfigManager:
             是否导出成功
         """
         try:
+            # 默认配置可能从未落盘，导出前确保文件存在
+            if not self.config_file.exists() and not self.save_config():
+                return False
             shutil.copy2(self.config_file, export_path)
             self.logger.info(f"配置导出成功: {export_path}")
             return True
@@ -192,7 +192,7 @@ class DeviceCommunicator:
                 self.logger.info(f"通信尝试 {attempt + 1}/{self.config.max_retries + 1}")
 
                 # 显示发送的帧
-                frame_hex = ''.join(f'{b:02X}' for b in request_frame)
+                frame_hex = bytes(request_frame).hex().upper()
                 self.logger.info(f"Tx> {frame_hex} ({len(request_frame)}字节)")
 
                 # 发送帧
@@ -205,7 +205,7 @@ class DeviceCommunicator:
 
                 if response_frame:
                     # 显示接收的帧
-                    response_hex = ''.join(f'{b:02X}' for b in response_frame)
+                    response_hex = bytes(response_frame).hex().upper()
                     self.logger.info(f"Rx> {response_hex} ({len(response_frame)}字节)")
                     # 验证响应
                     if self.config.validate_response:
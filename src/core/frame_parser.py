@@ -5,10 +5,17 @@
 DL/T645响应帧解析，与Excel算法逆向等价
 """
 
-from typing import Dict, List, Optional, Union, Any
+import copy
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Union, Any
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
+from ._kernels import frame_checksum
+
 class FrameParseResult(Enum):
     """帧解析结果类型"""
     SUCCESS = "success"
@@ -17,22 +24,22 @@ class FrameParseResult(Enum):
     LENGTH_ERROR = "length_error"
     UNKNOWN_ERROR = "unknown_error"
 
-@dataclass
+@dataclass(slots=True)
 class ParsedFrame:
     """解析后的帧数据结构"""
     # 基本帧信息
-    raw_frame: bytes
-    frame_hex: str
+    raw_frame: Union[bytes, memoryview]
     parse_result: FrameParseResult
     error_message: Optional[str] = None
+    _frame_hex: Optional[str] = None  # frame_hex懒计算缓存
 
-    # 帧结构字段
+    # 帧结构字段 (address/data_field为原始帧的零拷贝视图)
     start_marker1: Optional[int] = None
-    address: Optional[bytes] = None
+    address: Optional[Union[bytes, memoryview]] = None
     start_marker2: Optional[int] = None
     control_code: Optional[int] = None
     data_length: Optional[int] = None
-    data_field: Optional[bytes] = None
+    data_field: Optional[Union[bytes, memoryview]] = None
     checksum: Optional[int] = None
     end_marker: Optional[int] = None
 
@@ -47,13 +54,22 @@ class ParsedFrame:
     calculated_checksum: Optional[int] = None
     checksum_valid: bool = False
 
-    def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式"""
-        return {
-            'parse_result': self.parse_result.value,
-            'error_message': self.error_message,
-            'frame_hex': self.frame_hex,
-            'frame_info': {
+    # 懒计算的字典视图缓存
+    _frame_info: Optional[Dict[str, Any]] = None
+    _data_info: Optional[Dict[str, Any]] = None
+
+    @property
+    def frame_hex(self) -> str:
+        """帧的十六进制字符串 (首次访问时计算并缓存)"""
+        if self._frame_hex is None:
+            self._frame_hex = self.raw_frame.hex().upper()
+        return self._frame_hex
+
+    @property
+    def frame_info_dict(self) -> Dict[str, Any]:
+        """帧结构字段的字典视图 (首次访问时格式化并缓存)"""
+        if self._frame_info is None:
+            self._frame_info = {
                 'start_marker1': f"0x{self.start_marker1:02X}" if self.start_marker1 else None,
                 'address': self.address.hex().upper() if self.address else None,
                 'start_marker2': f"0x{self.start_marker2:02X}" if self.start_marker2 else None,
@@ -62,14 +78,30 @@ class ParsedFrame:
                 'checksum': f"0x{self.checksum:02X}" if self.checksum else None,
                 'checksum_valid': self.checksum_valid,
                 'end_marker': f"0x{self.end_marker:02X}" if self.end_marker else None,
-            },
-            'data_info': {
+            }
+        return self._frame_info
+
+    @property
+    def data_info_dict(self) -> Dict[str, Any]:
+        """数据域字段的字典视图 (首次访问时格式化并缓存)"""
+        if self._data_info is None:
+            self._data_info = {
                 'di_code': self.di_code,
                 'di_original': self.di_original,
                 'parameter_data': self.parameter_data.hex().upper() if self.parameter_data else None,
                 'password_field': self.password_field.hex().upper() if self.password_field else None,
                 'operator_field': self.operator_field.hex().upper() if self.operator_field else None,
             }
+        return self._data_info
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典格式 (各部分懒计算，只取部分字段时不做全量格式化)"""
+        return {
+            'parse_result': self.parse_result.value,
+            'error_message': self.error_message,
+            'frame_hex': self.frame_hex,
+            'frame_info': self.frame_info_dict,
+            'data_info': self.data_info_dict
         }
 
 class DLT645FrameParser:
@@ -79,38 +111,91 @@ class DLT645FrameParser:
     以及真实设备返回的响应帧
     """
 
+    # 解析结果LRU缓存参数：回放/对比场景下重复帧直接命中
+    CACHE_MAX_ENTRIES = 128
+    CACHE_MAX_FRAME_SIZE = 256  # 超过此长度的帧不缓存，限制内存占用
+
+    # 预编译帧头结构: 起始符1 + 地址(6字节) + 起始符2 + 控制码 + 数据长度
+    _HDR = struct.Struct('>B6sBBB')
+
+    # 批量解析结果的结构化dtype
+    BATCH_DTYPE = np.dtype([
+        ('length', np.int32),
+        ('valid', np.bool_),
+        ('checksum_valid', np.bool_),
+        ('control_code', np.uint8),
+        ('data_length', np.uint8),
+        ('checksum', np.uint8),
+        ('calculated_checksum', np.uint8),
+        ('address', np.uint8, (6,)),
+    ])
+
     def __init__(self):
         self.DATA_OFFSET = 0x33  # 0x33偏置
-
-    def parse_frame(self, frame_data: Union[bytes, str]) -> ParsedFrame:
+        # 预计算256项去偏置查找表，translate一次C调用完成逐字节变换
+        self._DEOFFSET_TABLE = bytes((b - 0x33) & 0xFF for b in range(256))
+        # 解析结果LRU缓存
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def parse_frame(self, frame_data: Union[bytes, bytearray, memoryview, str]) -> ParsedFrame:
         """解析DL/T645帧
 
         Args:
-            frame_data: 帧数据，可以是bytes或十六进制字符串
+            frame_data: 帧数据，可以是十六进制字符串或任意缓冲区协议对象
+                        (bytes/bytearray/memoryview等)
 
         Returns:
             ParsedFrame对象
         """
-        # 统一转换为bytes
+        # 字符串先转换为bytes，缓冲区对象直接走零拷贝路径
         if isinstance(frame_data, str):
+            # 无空格的十六进制串 (Excel导出的常见形态) 跳过replace全量拷贝
+            s = frame_data
+            if ' ' in s:
+                s = s.replace(' ', '')
             try:
-                frame_bytes = bytes.fromhex(frame_data.replace(' ', ''))
-                frame_hex = frame_data.replace(' ', '').upper()
+                frame_bytes = bytes.fromhex(s)
             except ValueError:
                 return ParsedFrame(
                     raw_frame=b'',
-                    frame_hex=frame_data,
                     parse_result=FrameParseResult.INVALID_FORMAT,
-                    error_message="无效的十六进制字符串"
+                    error_message="无效的十六进制字符串",
+                    _frame_hex=frame_data
                 )
-        else:
+            return self.parse_buffer(frame_bytes)
+
+        return self.parse_buffer(frame_data)
+
+    def parse_buffer(self, frame_data: Union[bytes, bytearray, memoryview]) -> ParsedFrame:
+        """解析缓冲区协议对象，跳过字符串分支
+
+        bytearray/memoryview/numpy缓冲区不拷贝为bytes，
+        内部统一以memoryview操作，切片均为视图
+
+        Args:
+            frame_data: 任意缓冲区协议对象
+
+        Returns:
+            ParsedFrame对象
+        """
+        if isinstance(frame_data, bytes):
             frame_bytes = frame_data
-            frame_hex = frame_data.hex().upper()
 
-        # 创建基本ParsedFrame对象
+            # LRU缓存命中：返回浅拷贝，避免调用方修改污染缓存条目
+            cached = self._parse_cache.get(frame_bytes)
+            if cached is not None:
+                self._parse_cache.move_to_end(frame_bytes)
+                self._cache_hits += 1
+                return copy.copy(cached)
+            self._cache_misses += 1
+        else:
+            frame_bytes = memoryview(frame_data).cast('B')
+
+        # 创建基本ParsedFrame对象 (frame_hex懒计算，批量回放时不白白格式化)
         parsed = ParsedFrame(
             raw_frame=frame_bytes,
-            frame_hex=frame_hex,
             parse_result=FrameParseResult.SUCCESS
         )
 
@@ -121,11 +206,8 @@ class DLT645FrameParser:
                 parsed.error_message = f"帧长度过短: {len(frame_bytes)}字节，最少需要12字节"
                 return parsed
 
-            # 解析帧结构
-            self._parse_frame_structure(frame_bytes, parsed)
-
-            # 验证校验和
-            self._verify_checksum(frame_bytes, parsed)
+            # 单遍解析帧结构并验证校验和
+            self._parse_frame_hot(frame_bytes, parsed)
 
             # 解析数据域
             if parsed.data_field:
@@ -135,69 +217,146 @@ class DLT645FrameParser:
             parsed.parse_result = FrameParseResult.UNKNOWN_ERROR
             parsed.error_message = f"解析异常: {str(e)}"
 
+        # 仅缓存不可变bytes输入的小帧 (可变缓冲区内容可能变化，不可作键)
+        if isinstance(frame_bytes, bytes) and len(frame_bytes) <= self.CACHE_MAX_FRAME_SIZE:
+            self._parse_cache[frame_bytes] = copy.copy(parsed)
+            if len(self._parse_cache) > self.CACHE_MAX_ENTRIES:
+                self._parse_cache.popitem(last=False)
+
         return parsed
 
-    def _parse_frame_structure(self, frame_bytes: bytes, parsed: ParsedFrame):
-        """解析帧基本结构"""
-        # 起始符1
-        parsed.start_marker1 = frame_bytes[0]
-        if parsed.start_marker1 != 0x68:
-            parsed.parse_result = FrameParseResult.INVALID_FORMAT
-            parsed.error_message = f"无效的起始符1: 0x{parsed.start_marker1:02X}, 期望0x68"
-            return
+    def parse_frames_batch(self, buffers: Sequence[bytes]) -> np.ndarray:
+        """批量解析DL/T645帧 (日志回放/批量对比场景)
 
-        # 地址域 (6字节)
-        parsed.address = frame_bytes[1:7]
+        所有帧零填充堆叠为(N, Lmax)的uint8矩阵，起始符/结束符/长度/
+        校验和检查全部以向量操作完成，避免逐帧Python循环。
+        需要逐帧详情 (DI码、数据域等) 时再对感兴趣的行调用parse_frame。
+
+        Args:
+            buffers: 帧字节串序列
+
+        Returns:
+            BATCH_DTYPE结构化ndarray，每行对应一个输入帧
+        """
+        n = len(buffers)
+        out = np.zeros(n, dtype=self.BATCH_DTYPE)
+        if n == 0:
+            return out
+
+        lengths = np.fromiter((len(b) for b in buffers), dtype=np.int64, count=n)
+        out['length'] = lengths
+        lmax = int(lengths.max())
+        if lmax < 12:  # 所有帧都短于最小帧长
+            return out
+
+        # 堆叠为零填充矩阵
+        arr = np.zeros((n, lmax), dtype=np.uint8)
+        for i, buf in enumerate(buffers):
+            arr[i, :lengths[i]] = np.frombuffer(buf, dtype=np.uint8)
+
+        rows = np.arange(n)
+        end_bytes = arr[rows, np.maximum(lengths - 1, 0)]
+        checksum_bytes = arr[rows, np.maximum(lengths - 2, 0)]
+
+        # 按行屏蔽校验和范围 (帧尾校验和+结束符除外) 后uint8求和，自动模256
+        mask = np.arange(lmax) < (lengths - 2)[:, None]
+        calculated = (arr * mask).sum(axis=1, dtype=np.uint8)
+
+        out['control_code'] = arr[:, 8]
+        out['data_length'] = arr[:, 9]
+        out['checksum'] = checksum_bytes
+        out['calculated_checksum'] = calculated
+        out['address'] = arr[:, 1:7]
+
+        checksum_valid = (calculated == checksum_bytes)
+        structure_valid = (
+            (lengths >= 12)
+            & (arr[:, 0] == 0x68)
+            & (arr[:, 7] == 0x68)
+            & (end_bytes == 0x16)
+            & (lengths == arr[:, 9].astype(np.int64) + 12)
+        )
+        out['checksum_valid'] = checksum_valid
+        out['valid'] = structure_valid & checksum_valid
+        return out
 
-        # 起始符2
-        parsed.start_marker2 = frame_bytes[7]
-        if parsed.start_marker2 != 0x68:
+    def cache_info(self) -> Dict[str, int]:
+        """返回解析缓存统计"""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._parse_cache),
+            'max_size': self.CACHE_MAX_ENTRIES
+        }
+
+    def cache_clear(self):
+        """清空解析缓存"""
+        self._parse_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def _parse_frame_hot(self, frame_bytes: bytes, parsed: ParsedFrame):
+        """单遍解析帧结构并验证校验和
+
+        热路径：字段先提取到局部变量，最后批量写回ParsedFrame，
+        减少每帧的Python属性访问次数（Cython化的纯Python等价实现）
+        """
+        # 一次unpack取出帧头五个字段，合并起始符检查为单分支
+        start_marker1, _, start_marker2, control_code, data_length = \
+            self._HDR.unpack_from(frame_bytes)
+
+        # 地址域/数据域保持零拷贝视图，调用方需要时再物化
+        mv = frame_bytes if isinstance(frame_bytes, memoryview) else memoryview(frame_bytes)
+        address = mv[1:7]
+
+        if (start_marker1 ^ 0x68) | (start_marker2 ^ 0x68):
+            # 仅失败分支才构造诊断字符串
+            parsed.start_marker1 = start_marker1
+            if start_marker1 != 0x68:
+                parsed.parse_result = FrameParseResult.INVALID_FORMAT
+                parsed.error_message = f"无效的起始符1: 0x{start_marker1:02X}, 期望0x68"
+                return
+            parsed.address = address
+            parsed.start_marker2 = start_marker2
             parsed.parse_result = FrameParseResult.INVALID_FORMAT
-            parsed.error_message = f"无效的起始符2: 0x{parsed.start_marker2:02X}, 期望0x68"
+            parsed.error_message = f"无效的起始符2: 0x{start_marker2:02X}, 期望0x68"
             return
 
-        # 控制码
-        parsed.control_code = frame_bytes[8]
-
-        # 数据长度
-        parsed.data_length = frame_bytes[9]
+        parsed.start_marker1 = start_marker1
+        parsed.address = address
+        parsed.start_marker2 = start_marker2
+        parsed.control_code = control_code
+        parsed.data_length = data_length
 
         # 验证帧长度是否与数据长度匹配
-        expected_frame_len = 10 + parsed.data_length + 1 + 1  # 头部+数据+校验和+结束符
+        expected_frame_len = 10 + data_length + 1 + 1  # 头部+数据+校验和+结束符
         if len(frame_bytes) != expected_frame_len:
             parsed.parse_result = FrameParseResult.LENGTH_ERROR
             parsed.error_message = f"帧长度不匹配: 实际{len(frame_bytes)}字节, 期望{expected_frame_len}字节"
             return
 
-        # 数据域
-        if parsed.data_length > 0:
-            parsed.data_field = frame_bytes[10:10 + parsed.data_length]
-
-        # 校验和
-        parsed.checksum = frame_bytes[10 + parsed.data_length]
+        # 数据域 (零拷贝视图)
+        if data_length > 0:
+            parsed.data_field = mv[10:10 + data_length]
 
-        # 结束符
-        parsed.end_marker = frame_bytes[10 + parsed.data_length + 1]
-        if parsed.end_marker != 0x16:
+        # 校验和 + 结束符
+        checksum = frame_bytes[10 + data_length]
+        end_marker = frame_bytes[10 + data_length + 1]
+        parsed.checksum = checksum
+        parsed.end_marker = end_marker
+        if end_marker != 0x16:
             parsed.parse_result = FrameParseResult.INVALID_FORMAT
-            parsed.error_message = f"无效的结束符: 0x{parsed.end_marker:02X}, 期望0x16"
-            return
-
-    def _verify_checksum(self, frame_bytes: bytes, parsed: ParsedFrame):
-        """验证校验和"""
-        if parsed.data_length is None or parsed.checksum is None:
-            return
+            parsed.error_message = f"无效的结束符: 0x{end_marker:02X}, 期望0x16"
 
         # 计算校验和 (整个帧除了校验和和结束符)
-        checksum_data = frame_bytes[:-2]
-        calculated = sum(checksum_data) & 0xFF
-
+        # JIT编译的本地循环，自动模256回绕，避免逐字节Python迭代
+        calculated = frame_checksum(frame_bytes, count=len(frame_bytes) - 2)
         parsed.calculated_checksum = calculated
-        parsed.checksum_valid = (calculated == parsed.checksum)
+        parsed.checksum_valid = (calculated == checksum)
 
         if not parsed.checksum_valid:
             parsed.parse_result = FrameParseResult.CHECKSUM_ERROR
-            parsed.error_message = f"校验和错误: 计算0x{calculated:02X}, 帧中0x{parsed.checksum:02X}"
+            parsed.error_message = f"校验和错误: 计算0x{calculated:02X}, 帧中0x{checksum:02X}"
 
     def _parse_data_field(self, data_field: bytes, parsed: ParsedFrame):
         """解析数据域"""
@@ -206,8 +365,10 @@ class DLT645FrameParser:
             return
 
         try:
-            # 移除0x33偏置
-            deoffset_data = [(b - self.DATA_OFFSET) & 0xFF for b in data_field]
+            # 移除0x33偏置 (预计算查找表，一次translate调用)
+            if not isinstance(data_field, bytes):
+                data_field = bytes(data_field)
+            deoffset_data = data_field.translate(self._DEOFFSET_TABLE)
 
             # 解析DI码 (前4字节)
             di_bytes = deoffset_data[:4]
@@ -216,7 +377,7 @@ class DLT645FrameParser:
             # 原始顺序: 00 15 F8 00 -> 翻转为: 00 F8 15 00
             di_restored = f"{di_bytes[3]:02X}{di_bytes[2]:02X}{di_bytes[1]:02X}{di_bytes[0]:02X}"
             parsed.di_original = di_restored
-            parsed.di_code = ' '.join(f"{b:02X}" for b in di_bytes)
+            parsed.di_code = di_bytes.hex(' ').upper()
 
             # 解析其余数据
             remaining_data = deoffset_data[4:]
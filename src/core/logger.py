@@ -5,11 +5,31 @@ RN8213/RN8211B 电表校准工具 v2.0 - 日志系统
 实现通信日志记录和格式化显示
 """
 
+import struct
 import time
+from collections import deque
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Deque, List, Optional
 from enum import Enum
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from ._kernels import frame_checksum
+
+
+# 秒级缓存的时间戳格式化：同一秒内复用strftime结果，毫秒用整数运算拼接
+_last_sec_int = -1
+_last_sec_str = ""
+
+
+def _format_time_ms(t: float) -> str:
+    """格式化为 HH:MM:SS.mmm (缓存秒级字符串，避免每条日志strftime)"""
+    global _last_sec_int, _last_sec_str
+    sec = int(t)
+    if sec != _last_sec_int:
+        _last_sec_str = time.strftime("%H:%M:%S", time.localtime(sec))
+        _last_sec_int = sec
+    return f"{_last_sec_str}.{int((t - sec) * 1000):03d}"
 
 
 class LogLevel(Enum):
@@ -21,38 +41,66 @@ class LogLevel(Enum):
     COMM = "COMM"     # 通信日志
 
 
+# 预绑定各级别的拼接片段，避免每条日志重复访问Enum.value
+_LEVEL_PREFIX = {level: f" {level.value}: " for level in LogLevel}
+_LEVEL_PLAIN = {level: f"{level.value}: " for level in LogLevel}
+
+
 class LogEntry:
     """日志条目类"""
+    __slots__ = ('level', 'message', '_ts')
+
     def __init__(self, level: LogLevel, message: str, timestamp: datetime = None):
         self.level = level
         self.message = message
-        self.timestamp = timestamp or datetime.now()
+        # 内部存float时间戳，datetime对象仅在导出等场景懒构造
+        self._ts = timestamp.timestamp() if timestamp else time.time()
+
+    @property
+    def timestamp(self) -> datetime:
+        """懒构造的datetime时间戳"""
+        return datetime.fromtimestamp(self._ts)
 
     def to_string(self, show_timestamp: bool = True) -> str:
         """转换为字符串"""
         if show_timestamp:
-            time_str = self.timestamp.strftime("%H:%M:%S.%f")[:-3]
-            return f"[{time_str}] {self.level.value}: {self.message}"
+            return "[" + _format_time_ms(self._ts) + "]" + _LEVEL_PREFIX[self.level] + self.message
         else:
-            return f"{self.level.value}: {self.message}"
+            return _LEVEL_PLAIN[self.level] + self.message
+
+
+# 预计算的256项大写十六进制查找表 (多字符分隔符回退路径用)
+_HEX_U = [f"{i:02X}" for i in range(256)]
 
 
 class FrameLogEntry:
     """帧日志条目类"""
+    __slots__ = ('_ts', 'direction', 'frame_data', 'result', 'elapsed_time')
+
     def __init__(self, direction: str, frame_data: bytes, result: str = "", elapsed_time: float = 0):
-        self.timestamp = datetime.now()
+        self._ts = time.time()
         self.direction = direction  # "Tx" 或 "Rx"
         self.frame_data = frame_data
         self.result = result        # "CS OK", "CS BAD", "TIMEOUT" 等
         self.elapsed_time = elapsed_time  # 毫秒
 
+    @property
+    def timestamp(self) -> datetime:
+        """懒构造的datetime时间戳"""
+        return datetime.fromtimestamp(self._ts)
+
     def to_hex_string(self, separator: str = " ") -> str:
         """转换为十六进制字符串"""
-        return separator.join(f'{b:02X}' for b in self.frame_data)
+        # bytes.hex(sep)是单次C调用，避免逐字节Python生成器
+        if len(separator) == 1:
+            return self.frame_data.hex(separator).upper()
+        if not separator:
+            return self.frame_data.hex().upper()
+        return separator.join(_HEX_U[b] for b in self.frame_data)
 
     def to_display_string(self) -> str:
         """转换为显示字符串"""
-        time_str = self.timestamp.strftime("%H:%M:%S.%f")[:-3]
+        time_str = _format_time_ms(self._ts)
         hex_str = self.to_hex_string()
 
         # 构建显示字符串
@@ -65,28 +113,51 @@ class FrameLogEntry:
 class CalibrationLogger(QObject):
     """校准日志记录器"""
 
-    # 信号定义
-    log_added = pyqtSignal(str)        # 新日志添加信号
-    frame_logged = pyqtSignal(str)     # 帧日志添加信号
+    # 信号定义 (批量发射：定时器窗口内聚合为List[str]，减少跨线程排队和逐条UI刷新)
+    log_added = pyqtSignal(list)       # 新日志批量信号
+    frame_logged = pyqtSignal(list)    # 帧日志批量信号
+
+    # 批量发射的聚合窗口 (毫秒)
+    FLUSH_INTERVAL_MS = 50
 
     def __init__(self, max_entries: int = 1000):
         super().__init__()
         self.max_entries = max_entries
-        self.log_entries: List[LogEntry] = []
-        self.frame_entries: List[FrameLogEntry] = []
+        # deque(maxlen=...)自动淘汰最旧条目，O(1)追加，避免list.pop(0)整体搬移
+        self.log_entries: Deque[LogEntry] = deque(maxlen=max_entries)
+        self.frame_entries: Deque[FrameLogEntry] = deque(maxlen=max_entries)
         self._last_tx_time: Optional[float] = None
 
+        # 待发射缓冲与聚合定时器
+        self._pending_logs: List[str] = []
+        self._pending_frames: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
+    def _schedule_flush(self):
+        """安排一次批量发射 (事件循环不可用时由调用方flush_pending手动触发)"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush_pending(self):
+        """立即批量发射缓冲中的日志"""
+        if self._pending_logs:
+            batch, self._pending_logs = self._pending_logs, []
+            self.log_added.emit(batch)
+        if self._pending_frames:
+            batch, self._pending_frames = self._pending_frames, []
+            self.frame_logged.emit(batch)
+
     def log(self, level: LogLevel, message: str):
         """记录普通日志"""
         entry = LogEntry(level, message)
         self.log_entries.append(entry)
 
-        # 限制日志数量
-        if len(self.log_entries) > self.max_entries:
-            self.log_entries.pop(0)
-
-        # 发送信号
-        self.log_added.emit(entry.to_string())
+        # 缓冲并安排批量发射
+        self._pending_logs.append(entry.to_string())
+        self._schedule_flush()
 
     def debug(self, message: str):
         """记录调试日志"""
@@ -110,12 +181,9 @@ class CalibrationLogger(QObject):
         entry = FrameLogEntry("Tx", frame_data)
         self.frame_entries.append(entry)
 
-        # 限制帧日志数量
-        if len(self.frame_entries) > self.max_entries:
-            self.frame_entries.pop(0)
-
-        # 发送信号
-        self.frame_logged.emit(entry.to_display_string())
+        # 缓冲并安排批量发射
+        self._pending_frames.append(entry.to_display_string())
+        self._schedule_flush()
 
     def log_frame_rx(self, frame_data: bytes, result: str = ""):
         """记录接收帧"""
@@ -126,12 +194,9 @@ class CalibrationLogger(QObject):
         entry = FrameLogEntry("Rx", frame_data, result, elapsed_time)
         self.frame_entries.append(entry)
 
-        # 限制帧日志数量
-        if len(self.frame_entries) > self.max_entries:
-            self.frame_entries.pop(0)
-
-        # 发送信号
-        self.frame_logged.emit(entry.to_display_string())
+        # 缓冲并安排批量发射
+        self._pending_frames.append(entry.to_display_string())
+        self._schedule_flush()
 
         # 重置发送时间
         self._last_tx_time = None
@@ -142,12 +207,12 @@ class CalibrationLogger(QObject):
 
     def get_recent_logs(self, count: int = 50) -> List[str]:
         """获取最近的日志"""
-        recent_entries = self.log_entries[-count:] if count < len(self.log_entries) else self.log_entries
+        recent_entries = islice(self.log_entries, max(0, len(self.log_entries) - count), None)
         return [entry.to_string() for entry in recent_entries]
 
     def get_recent_frames(self, count: int = 50) -> List[str]:
         """获取最近的帧日志"""
-        recent_entries = self.frame_entries[-count:] if count < len(self.frame_entries) else self.frame_entries
+        recent_entries = islice(self.frame_entries, max(0, len(self.frame_entries) - count), None)
         return [entry.to_display_string() for entry in recent_entries]
 
     def clear_logs(self):
@@ -182,6 +247,9 @@ class CalibrationLogger(QObject):
 class DLT645FrameAnalyzer:
     """DL/T645帧分析器"""
 
+    # 预编译帧头结构: 起始符1 + 地址(6字节) + 起始符2 + 控制码 + 数据长度
+    _HDR = struct.Struct('>B6sBBB')
+
     @staticmethod
     def analyze_frame(frame_data: bytes) -> dict:
         """分析DL/T645帧结构
@@ -193,25 +261,26 @@ class DLT645FrameAnalyzer:
             return {'valid': False, 'error': '帧长度不足'}
 
         try:
-            # 基本结构检查
-            if frame_data[0] != 0x68:
-                return {'valid': False, 'error': '起始符错误'}
-
-            if frame_data[7] != 0x68:
-                return {'valid': False, 'error': '第二起始符错误'}
-
-            if frame_data[-1] != 0x16:
+            # 零拷贝视图：字段提取不再为切片分配bytes
+            mv = memoryview(frame_data)
+
+            # 一次unpack取出帧头，标记检查合并为单分支
+            marker1, address, marker2, control_code, data_length = \
+                DLT645FrameAnalyzer._HDR.unpack_from(mv)
+            end_marker = mv[len(mv) - 1]
+            if (marker1 ^ 0x68) | (marker2 ^ 0x68) | (end_marker ^ 0x16):
+                if marker1 != 0x68:
+                    return {'valid': False, 'error': '起始符错误'}
+                if marker2 != 0x68:
+                    return {'valid': False, 'error': '第二起始符错误'}
                 return {'valid': False, 'error': '结束符错误'}
 
-            # 提取字段
-            address = frame_data[1:7]
-            control_code = frame_data[8]
-            data_length = frame_data[9]
-            data_field = frame_data[10:10+data_length]
-            checksum = frame_data[10+data_length]
+            # 提取字段 (hex字符串仅在构造结果字典时由视图直接生成)
+            data_field = mv[10:10+data_length]
+            checksum = mv[10+data_length]
 
-            # 校验和验证
-            calc_checksum = sum(frame_data[7:10+data_length]) & 0xFF
+            # 校验和验证 (JIT编译的本地循环，自动模256回绕)
+            calc_checksum = frame_checksum(frame_data, count=3 + data_length, offset=7)
             cs_valid = (calc_checksum == checksum)
 
             return {
@@ -229,21 +298,27 @@ class DLT645FrameAnalyzer:
         except Exception as e:
             return {'valid': False, 'error': f'解析异常: {str(e)}'}
 
+    # 控制码→帧类型的256项LUT：直接索引代替每帧dict哈希查找
+    _FRAME_TYPE_LUT = [None] * 256
+    for _code, _name in {
+        0x01: '读数据',
+        0x02: '读后续数据',
+        0x04: '写数据',
+        0x11: '读数据应答',
+        0x12: '读后续数据应答',
+        0x14: '写数据应答',
+        0x81: '读数据异常应答',
+        0x82: '读后续数据异常应答',
+        0x84: '写数据异常应答'
+    }.items():
+        _FRAME_TYPE_LUT[_code] = _name
+    del _code, _name
+
     @staticmethod
     def _get_frame_type(control_code: int) -> str:
         """获取帧类型描述"""
-        frame_types = {
-            0x01: '读数据',
-            0x02: '读后续数据',
-            0x04: '写数据',
-            0x11: '读数据应答',
-            0x12: '读后续数据应答',
-            0x14: '写数据应答',
-            0x81: '读数据异常应答',
-            0x82: '读后续数据异常应答',
-            0x84: '写数据异常应答'
-        }
-        return frame_types.get(control_code, f'未知类型(0x{control_code:02X})')
+        return (DLT645FrameAnalyzer._FRAME_TYPE_LUT[control_code]
+                or f'未知类型(0x{control_code:02X})')
 
     @staticmethod
     def format_frame_analysis(analysis: dict) -> str:
@@ -6,74 +6,163 @@
 包括标准值验证、精度控制、单位转换、误差分析
 """
 
-from typing import Dict, Any, Optional, Tuple, Union
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+import base64
 import math
 import logging
-from enum import Enum
+import struct
+from enum import IntEnum
 
+import numpy as np
 
-class ParameterType(Enum):
-    """参数类型"""
-    VOLTAGE = "voltage"
-    CURRENT = "current"
-    POWER = "power"
-    FREQUENCY = "frequency"
-    PHASE = "phase"
-    ENERGY = "energy"
+from ._kernels import encode_values_le
 
+# 可选的AOT编译编码加速器：若存在预编译的_encode扩展(C/Cython)则优先使用，
+# 未编译时回退到运行时生成的特化纯Python编码函数
+try:
+    from ._encode import encode as _c_encode
+except ImportError:
+    _c_encode = None
 
-class ValidationResult(Enum):
-    """验证结果"""
-    VALID = "valid"
-    OUT_OF_RANGE = "out_of_range"
-    INVALID_FORMAT = "invalid_format"
-    PRECISION_ERROR = "precision_error"
 
+class ParameterType(IntEnum):
+    """参数类型 (IntEnum序号用于列表直接索引，字符串名见PARAMETER_TYPE_NAMES)"""
+    VOLTAGE = 0
+    CURRENT = 1
+    POWER = 2
+    FREQUENCY = 3
+    PHASE = 4
+    ENERGY = 5
 
-@dataclass
+
+# 序列化用的参数类型名 (按IntEnum序号排列)
+PARAMETER_TYPE_NAMES = ("voltage", "current", "power", "frequency", "phase", "energy")
+
+
+class ValidationResult(IntEnum):
+    """验证结果 (字符串名见VALIDATION_RESULT_NAMES)"""
+    VALID = 0
+    OUT_OF_RANGE = 1
+    INVALID_FORMAT = 2
+    PRECISION_ERROR = 3
+
+
+# 序列化用的验证结果名 (按IntEnum序号排列)
+VALIDATION_RESULT_NAMES = ("valid", "out_of_range", "invalid_format", "precision_error")
+
+
+@dataclass(slots=True)
 class ParameterRange:
     """参数范围定义"""
     min_value: float
     max_value: float
     precision_digits: int = 3
     unit: str = ""
+    _scale: int = field(init=False, default=0)
+
+    def __post_init__(self):
+        # 预计算精度检查的缩放系数，避免每次validate重算幂
+        self._scale = 10 ** self.precision_digits
 
     def validate(self, value: float) -> ValidationResult:
         """验证参数值是否在范围内"""
-        if not isinstance(value, (int, float)):
-            return ValidationResult.INVALID_FORMAT
+        return self.validate_scaled(value)[0]
 
-        if not (self.min_value <= value <= self.max_value):
-            return ValidationResult.OUT_OF_RANGE
+    def validate_scaled(self, value: float) -> Tuple[ValidationResult, int]:
+        """验证参数值并返回按精度缩放的整数
 
-        # 检查精度
-        rounded_value = round(value, self.precision_digits)
-        if abs(value - rounded_value) > (10 ** (-self.precision_digits - 1)):
-            return ValidationResult.PRECISION_ERROR
+        缩放整数可直接供编码路径复用，避免二次乘法/取整
+        """
+        # 非数值类型在比较时抛TypeError，异常路径代替逐次isinstance检查
+        try:
+            if not (self.min_value <= value <= self.max_value):
+                return ValidationResult.OUT_OF_RANGE, 0
+        except TypeError:
+            return ValidationResult.INVALID_FORMAT, 0
 
-        return ValidationResult.VALID
+        # 检查精度 (整数缩放比较，等价于round(value, n)对比)
+        scaled = value * self._scale
+        scaled_int = round(scaled)
+        if abs(scaled - scaled_int) > 0.1:
+            return ValidationResult.PRECISION_ERROR, scaled_int
 
+        return ValidationResult.VALID, scaled_int
 
-@dataclass
+
+@dataclass(slots=True)
 class CalculationResult:
     """计算结果"""
     encoded_value: bytes
     original_value: float
     validation_result: ValidationResult
     error_message: Optional[str] = None
-    encoding_info: Optional[Dict] = None
+    # 编码元组(参数类型, scale, bytes, signed, 单位, 缩放整数)，字典按需生成
+    encoding_spec: Optional[Tuple] = None
+    _encoding_info: Optional[Dict] = field(init=False, default=None, repr=False)
+
+    @property
+    def encoding_info(self) -> Optional[Dict]:
+        """编码信息字典 (首次访问时由encoding_spec生成并缓存)
+
+        happy path上多数调用方只取encoded_value，
+        延迟构建可省去每次编码的字典分配
+        """
+        if self._encoding_info is None and self.encoding_spec is not None:
+            param_type, scale, nbytes, signed, unit, scaled_int = self.encoding_spec
+            self._encoding_info = {
+                'parameter_type': PARAMETER_TYPE_NAMES[param_type],
+                'scale_factor': scale,
+                'byte_count': nbytes,
+                'signed': signed,
+                'unit': unit,
+                'scaled_value': scaled_int
+            }
+        return self._encoding_info
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self, *, pack: str = "hex") -> Dict[str, Any]:
+        """转为字典，pack选择encoded_value的打包格式
+
+        "hex": 大写十六进制 (默认，与日志显示一致)
+        "b64": base64，批量记录/传输时比hex少1/3字节且编码为单次C调用
+        "raw": 原始bytes，调用方自行处理
+        """
+        if pack == "hex":
+            encoded = self.encoded_value.hex().upper()
+        elif pack == "b64":
+            encoded = base64.b64encode(self.encoded_value).decode('ascii')
+        elif pack == "raw":
+            encoded = self.encoded_value
+        else:
+            raise ValueError(f"不支持的打包格式: {pack}")
         return {
-            'encoded_value': self.encoded_value.hex().upper(),
+            'encoded_value': encoded,
             'original_value': self.original_value,
-            'validation_result': self.validation_result.value,
+            'validation_result': VALIDATION_RESULT_NAMES[self.validation_result],
             'error_message': self.error_message,
             'encoding_info': self.encoding_info or {}
         }
 
 
+# (字节数, 有符号)到编码值边界的冻结查找表，免去逐次分支与幂运算
+_RANGE_TABLE = {
+    (2, False): (0, 65535),
+    (4, False): (0, 4294967295),
+    (2, True): (-32768, 32767),
+    (4, True): (-(2 ** 31), 2 ** 31 - 1),
+}
+
+
+def pack_results(results: List["CalculationResult"]) -> bytes:
+    """把一批计算结果的编码字节拼接后整体base64打包
+
+    拼接与编码各只做一次C调用，避免逐条hex/base64的Python往返
+    """
+    return base64.b64encode(b''.join(r.encoded_value for r in results))
+
+
 class ParameterCalculator:
     """参数计算引擎
 
@@ -84,28 +173,83 @@ class ParameterCalculator:
     - 精度控制和误差分析
     """
 
+    # 编码结果LRU缓存上限：校准扫描反复编码相同标准值 (220V/50Hz/1A等)
+    ENCODE_CACHE_MAX = 1024
+
     def __init__(self):
         self.logger = logging.getLogger("ParameterCalculator")
 
-        # 定义各类参数的标准范围
-        self.parameter_ranges = {
-            ParameterType.VOLTAGE: ParameterRange(50.0, 500.0, 2, "V"),
-            ParameterType.CURRENT: ParameterRange(0.001, 200.0, 3, "A"),
-            ParameterType.POWER: ParameterRange(0.01, 100000.0, 2, "W"),
-            ParameterType.FREQUENCY: ParameterRange(45.0, 65.0, 2, "Hz"),
-            ParameterType.PHASE: ParameterRange(-180.0, 180.0, 2, "度"),
-            ParameterType.ENERGY: ParameterRange(0.0, 999999.999, 3, "kWh")
-        }
+        # 编码结果LRU缓存，键为(参数类型, 按精度取整后的值)
+        self._encode_cache: OrderedDict = OrderedDict()
+
+        # 定义各类参数的标准范围 (按ParameterType序号排列，IntEnum直接索引)
+        self._ranges = (
+            ParameterRange(50.0, 500.0, 2, "V"),       # VOLTAGE
+            ParameterRange(0.001, 200.0, 3, "A"),      # CURRENT
+            ParameterRange(0.01, 100000.0, 2, "W"),    # POWER
+            ParameterRange(45.0, 65.0, 2, "Hz"),       # FREQUENCY
+            ParameterRange(-180.0, 180.0, 2, "度"),    # PHASE
+            ParameterRange(0.0, 999999.999, 3, "kWh")  # ENERGY
+        )
 
-        # DL/T645编码配置
-        self.encoding_configs = {
-            ParameterType.VOLTAGE: {'scale': 100, 'bytes': 2, 'signed': False},
-            ParameterType.CURRENT: {'scale': 1000, 'bytes': 4, 'signed': False},
-            ParameterType.POWER: {'scale': 100, 'bytes': 4, 'signed': False},
-            ParameterType.FREQUENCY: {'scale': 100, 'bytes': 2, 'signed': False},
-            ParameterType.PHASE: {'scale': 100, 'bytes': 2, 'signed': True},
-            ParameterType.ENERGY: {'scale': 1000, 'bytes': 4, 'signed': False}
-        }
+        # DL/T645编码配置 (按ParameterType序号排列: scale, bytes, signed)
+        self.encoding_configs = (
+            (100, 2, False),   # VOLTAGE
+            (1000, 4, False),  # CURRENT
+            (100, 4, False),   # POWER
+            (100, 2, False),   # FREQUENCY
+            (100, 2, True),    # PHASE
+            (1000, 4, False)   # ENERGY
+        )
+
+        # 预计算的编码参数表，避免每次编解码重算边界/重查配置:
+        # _enc: (scale, nbytes, signed, min_value, max_value, struct打包器)
+        # _np_configs: (缩放系数float, 小端dtype, 最小值, 最大值)
+        enc = []
+        np_configs = []
+        for scale, nbytes, signed in self.encoding_configs:
+            dtype = np.dtype(f"<{'i' if signed else 'u'}{nbytes}")
+            min_value, max_value = _RANGE_TABLE[(nbytes, signed)]
+            fmt = f"<{'i' if signed else 'I'}" if nbytes == 4 else f"<{'h' if signed else 'H'}"
+            # 预绑定struct.Struct，跳过int.to_bytes/from_bytes每次解析kwargs的通用路径
+            enc.append((scale, nbytes, signed, min_value, max_value, struct.Struct(fmt)))
+            np_configs.append((float(scale), dtype, min_value, max_value))
+        self._enc = tuple(enc)
+        self._np_configs = tuple(np_configs)
+
+        # 校表参数组合验证的固定顺序与预计算边界向量
+        self._vcal_order = [
+            ('电压', ParameterType.VOLTAGE),
+            ('电流', ParameterType.CURRENT),
+            ('频率', ParameterType.FREQUENCY),
+            ('相位角', ParameterType.PHASE),
+            ('计算功率', ParameterType.POWER),
+        ]
+        vcal_ranges = [self._ranges[pt] for _, pt in self._vcal_order]
+        self._vcal_mins = np.array([r.min_value for r in vcal_ranges])
+        self._vcal_maxes = np.array([r.max_value for r in vcal_ranges])
+        self._vcal_pscales = np.array([10.0 ** r.precision_digits for r in vcal_ranges])
+
+        # 每类型生成特化编码函数：scale/边界内联为字面量，打包器预绑定 (部分求值)
+        # 若安装了AOT编译的_encode扩展，则绑定到C实现
+        encoders = []
+        for scale, nbytes, signed, min_value, max_value, packer in self._enc:
+            if _c_encode is not None:
+                encoders.append(partial(_c_encode, scale=scale,
+                                        nbytes=nbytes, signed=signed))
+                continue
+            source = (
+                f"def _encode(v, _pack=_pack, _round=round):\n"
+                f"    s = int(_round(v * {scale}))\n"
+                f"    if not ({min_value} <= s <= {max_value}):\n"
+                f"        raise ValueError(\n"
+                f"            f'编码值超出范围: {{s}} not in [{min_value}, {max_value}]')\n"
+                f"    return _pack(s)\n"
+            )
+            namespace = {'_pack': packer.pack}
+            exec(source, namespace)
+            encoders.append(namespace['_encode'])
+        self._encoders = tuple(encoders)
 
     def calculate_voltage_params(self, standard_voltage: float) -> CalculationResult:
         """计算电压参数
@@ -169,6 +313,27 @@ class ParameterCalculator:
 
         return result
 
+    def calculate_power_params_batch(self, voltages: Union[np.ndarray, list],
+                                     currents: Union[np.ndarray, list],
+                                     power_factors: Union[np.ndarray, list]) -> bytes:
+        """批量计算功率参数 ((V, I, PF)扫描场景)
+
+        功率乘积用NumPy ufunc一次算完，再交给批量编码内核，
+        避免N次标量Python调用。输入传float64的np.ndarray可零拷贝
+
+        Args:
+            voltages: 电压值数组(V)
+            currents: 电流值数组(A)
+            power_factors: 功率因数数组
+
+        Returns:
+            连续的小端编码字节流 (N * 4字节)
+        """
+        power_values = (np.asarray(voltages, dtype=np.float64)
+                        * np.asarray(currents, dtype=np.float64)
+                        * np.asarray(power_factors, dtype=np.float64))
+        return self.encode_batch(power_values, ParameterType.POWER)
+
     def calculate_frequency_params(self, frequency: float) -> CalculationResult:
         """计算频率参数
 
@@ -211,11 +376,13 @@ class ParameterCalculator:
         Returns:
             计算结果
         """
-        self.logger.debug(f"计算{description}: {value}")
+        # 仅在DEBUG启用时才格式化日志消息 (热路径上默认关闭)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"计算{description}: {value}")
 
         try:
             # 1. 验证参数范围
-            param_range = self.parameter_ranges.get(param_type)
+            param_range = self._ranges[param_type] if 0 <= param_type < len(self._ranges) else None
             if not param_range:
                 return CalculationResult(
                     encoded_value=b'',
@@ -224,7 +391,7 @@ class ParameterCalculator:
                     error_message=f"不支持的参数类型: {param_type}"
                 )
 
-            validation_result = param_range.validate(value)
+            validation_result, scaled_int = param_range.validate_scaled(value)
             if validation_result != ValidationResult.VALID:
                 error_msg = self._get_validation_error_message(validation_result, param_range, value)
                 return CalculationResult(
@@ -234,25 +401,17 @@ class ParameterCalculator:
                     error_message=error_msg
                 )
 
-            # 2. 编码为DL/T645格式
-            encoded_value = self.encode_to_dl645_format(value, param_type)
-
-            # 3. 创建编码信息
-            encoding_config = self.encoding_configs[param_type]
-            encoding_info = {
-                'parameter_type': param_type.value,
-                'scale_factor': encoding_config['scale'],
-                'byte_count': encoding_config['bytes'],
-                'signed': encoding_config['signed'],
-                'unit': param_range.unit,
-                'scaled_value': int(value * encoding_config['scale'])
-            }
+            # 2. 编码为DL/T645格式 (复用验证阶段已缩放的整数)
+            encoded_value = self._pack_scaled(scaled_int, param_type)
 
+            # 3. 记录编码元组，信息字典由CalculationResult按需生成
+            scale, nbytes, signed, _, _, _ = self._enc[param_type]
             return CalculationResult(
                 encoded_value=encoded_value,
                 original_value=value,
                 validation_result=ValidationResult.VALID,
-                encoding_info=encoding_info
+                encoding_spec=(param_type, scale, nbytes, signed,
+                               param_range.unit, scaled_int)
             )
 
         except Exception as e:
@@ -274,30 +433,85 @@ class ParameterCalculator:
         Returns:
             编码后的字节数据
         """
-        encoding_config = self.encoding_configs.get(param_type)
-        if not encoding_config:
+        if not 0 <= param_type < len(self._encoders):
             raise ValueError(f"不支持的参数类型: {param_type}")
 
-        # 缩放处理
-        scaled_value = int(round(physical_value * encoding_config['scale']))
+        # 按精度取整作键，使220.00与220.000000001命中同一缓存项
+        key = (param_type, round(physical_value, self._ranges[param_type].precision_digits))
+        cached = self._encode_cache.get(key)
+        if cached is not None:
+            self._encode_cache.move_to_end(key)
+            return cached
 
-        # 范围检查
-        if encoding_config['signed']:
-            max_value = 2 ** (encoding_config['bytes'] * 8 - 1) - 1
-            min_value = -2 ** (encoding_config['bytes'] * 8 - 1)
-        else:
-            max_value = 2 ** (encoding_config['bytes'] * 8) - 1
-            min_value = 0
+        # 特化编码函数：缩放/范围检查/打包的常量均已内联
+        encoded = self._encoders[param_type](key[1])
+
+        self._encode_cache[key] = encoded
+        if len(self._encode_cache) > self.ENCODE_CACHE_MAX:
+            self._encode_cache.popitem(last=False)
+        return encoded
+
+    def _pack_scaled(self, scaled_value: int, param_type: ParameterType) -> bytes:
+        """打包已按精度缩放的整数 (内部热路径，复用validate_scaled的结果)
 
+        各参数类型的精度缩放系数与编码缩放系数一致，
+        校验阶段得到的整数可直接打包，省去二次乘法/取整
+        """
+        _, _, _, min_value, max_value, packer = self._enc[param_type]
         if not (min_value <= scaled_value <= max_value):
-            raise ValueError(f"编码值超出范围: {scaled_value} not in [{min_value}, {max_value}]")
+            raise ValueError(
+                f"编码值超出范围: {scaled_value} not in [{min_value}, {max_value}]")
+        return packer.pack(scaled_value)
 
-        # 编码为字节
-        return scaled_value.to_bytes(
-            encoding_config['bytes'],
-            byteorder='little',
-            signed=encoding_config['signed']
-        )
+    def encode_batch(self, values: Union[np.ndarray, list], param_type: ParameterType) -> bytes:
+        """批量编码物理值为DL/T645格式 (校准扫描等批量场景)
+
+        缩放/取整/范围检查/打包全部为向量化操作，避免逐值Python往返
+
+        Args:
+            values: 物理量值数组
+            param_type: 参数类型
+
+        Returns:
+            连续的小端编码字节流 (N * bytes)
+        """
+        if not 0 <= param_type < len(self._np_configs):
+            raise ValueError(f"不支持的参数类型: {param_type}")
+        np_config = self._np_configs[param_type]
+
+        scale, dtype, min_value, max_value = np_config
+        arr = np.ascontiguousarray(values, dtype=np.float64)
+        out = np.empty((arr.shape[0], dtype.itemsize), dtype=np.uint8)
+
+        # JIT内核一趟完成缩放-取整-范围检查-小端打包
+        bad = encode_values_le(arr, scale, dtype.itemsize, min_value, max_value, out)
+        if bad >= 0:
+            scaled = int(round(float(arr[bad]) * scale))
+            raise ValueError(
+                f"编码值超出范围: {scaled} not in [{min_value}, {max_value}]")
+
+        return out.tobytes()
+
+    def decode_batch(self, dl645_data: bytes, param_type: ParameterType) -> np.ndarray:
+        """批量解码DL/T645格式为物理值
+
+        Args:
+            dl645_data: 连续的小端编码字节流 (N * bytes)
+            param_type: 参数类型
+
+        Returns:
+            物理量值的float64数组
+        """
+        if not 0 <= param_type < len(self._np_configs):
+            raise ValueError(f"不支持的参数类型: {param_type}")
+        np_config = self._np_configs[param_type]
+
+        scale, dtype, _, _ = np_config
+        if len(dl645_data) % dtype.itemsize != 0:
+            raise ValueError(
+                f"数据长度不匹配: {len(dl645_data)}字节不是{dtype.itemsize}的整数倍")
+
+        return np.frombuffer(dl645_data, dtype=dtype) / scale
 
     def decode_from_dl645_format(self, dl645_data: bytes, param_type: ParameterType) -> float:
         """从DL/T645格式解码为物理值
@@ -309,22 +523,20 @@ class ParameterCalculator:
         Returns:
             物理量值
         """
-        encoding_config = self.encoding_configs.get(param_type)
-        if not encoding_config:
+        if not 0 <= param_type < len(self._enc):
             raise ValueError(f"不支持的参数类型: {param_type}")
+        enc = self._enc[param_type]
 
-        if len(dl645_data) != encoding_config['bytes']:
-            raise ValueError(f"数据长度不匹配: 期望{encoding_config['bytes']}字节, 实际{len(dl645_data)}字节")
+        scale, nbytes, _, _, _, packer = enc
 
-        # 解码为整数
-        scaled_value = int.from_bytes(
-            dl645_data,
-            byteorder='little',
-            signed=encoding_config['signed']
-        )
+        if len(dl645_data) != nbytes:
+            raise ValueError(f"数据长度不匹配: 期望{nbytes}字节, 实际{len(dl645_data)}字节")
+
+        # 解码为整数 (预绑定的struct解包)
+        (scaled_value,) = packer.unpack(dl645_data)
 
         # 还原为物理值
-        return scaled_value / encoding_config['scale']
+        return scaled_value / scale
 
     def calculate_error_percentage(self, measured_value: float, standard_value: float) -> float:
         """计算误差百分比
@@ -356,48 +568,41 @@ class ParameterCalculator:
         Returns:
             验证结果字典
         """
+        # 五个值一次性做向量化范围+精度检查 (含派生的功率)
+        values = np.array([voltage, current, frequency, phase, voltage * current],
+                          dtype=np.float64)
+        in_range = (values >= self._vcal_mins) & (values <= self._vcal_maxes)
+        scaled = values * self._vcal_pscales
+        precise = np.abs(scaled - np.rint(scaled)) <= 0.1
+
         results = {}
         all_valid = True
 
-        # 验证各个参数
-        params_to_validate = [
-            (voltage, ParameterType.VOLTAGE, "电压"),
-            (current, ParameterType.CURRENT, "电流"),
-            (frequency, ParameterType.FREQUENCY, "频率"),
-            (phase, ParameterType.PHASE, "相位角")
-        ]
+        for i, (name, param_type) in enumerate(self._vcal_order):
+            param_range = self._ranges[param_type]
+            value = float(values[i])
 
-        for value, param_type, name in params_to_validate:
-            param_range = self.parameter_ranges[param_type]
-            validation = param_range.validate(value)
+            if not in_range[i]:
+                validation = ValidationResult.OUT_OF_RANGE
+            elif not precise[i]:
+                validation = ValidationResult.PRECISION_ERROR
+            else:
+                validation = ValidationResult.VALID
+            valid = (validation == ValidationResult.VALID)
 
             results[name] = {
                 'value': value,
-                'validation': validation.value,
+                'validation': VALIDATION_RESULT_NAMES[validation],
                 'range': f"{param_range.min_value}~{param_range.max_value}{param_range.unit}",
-                'valid': validation == ValidationResult.VALID
+                'valid': valid
             }
 
-            if validation != ValidationResult.VALID:
+            if not valid:
                 all_valid = False
-                results[name]['error'] = self._get_validation_error_message(
-                    validation, param_range, value
-                )
-
-        # 计算功率并验证
-        power = voltage * current
-        power_range = self.parameter_ranges[ParameterType.POWER]
-        power_validation = power_range.validate(power)
-
-        results['计算功率'] = {
-            'value': power,
-            'validation': power_validation.value,
-            'range': f"{power_range.min_value}~{power_range.max_value}{power_range.unit}",
-            'valid': power_validation == ValidationResult.VALID
-        }
-
-        if power_validation != ValidationResult.VALID:
-            all_valid = False
+                if name != '计算功率':
+                    results[name]['error'] = self._get_validation_error_message(
+                        validation, param_range, value
+                    )
 
         return {
             'all_valid': all_valid,
@@ -426,14 +631,13 @@ class ParameterCalculator:
         Returns:
             参数信息字典
         """
-        param_range = self.parameter_ranges.get(param_type)
-        encoding_config = self.encoding_configs.get(param_type)
-
-        if not param_range or not encoding_config:
+        if not 0 <= param_type < len(self._ranges):
             return {}
+        param_range = self._ranges[param_type]
+        scale, nbytes, signed = self.encoding_configs[param_type]
 
         return {
-            'type': param_type.value,
+            'type': PARAMETER_TYPE_NAMES[param_type],
             'range': {
                 'min': param_range.min_value,
                 'max': param_range.max_value,
@@ -441,9 +645,9 @@ class ParameterCalculator:
                 'unit': param_range.unit
             },
             'encoding': {
-                'scale_factor': encoding_config['scale'],
-                'byte_count': encoding_config['bytes'],
-                'signed': encoding_config['signed']
+                'scale_factor': scale,
+                'byte_count': nbytes,
+                'signed': signed
             }
         }
 
@@ -489,7 +693,7 @@ if __name__ == "__main__":
         if info:
             range_info = info['range']
             encoding_info = info['encoding']
-            print(f"{param_type.value}: {range_info['min']}~{range_info['max']}{range_info['unit']}, "
+            print(f"{PARAMETER_TYPE_NAMES[param_type]}: {range_info['min']}~{range_info['max']}{range_info['unit']}, "
                   f"缩放x{encoding_info['scale_factor']}, {encoding_info['byte_count']}字节")
 
     print("\n=== 参数计算引擎测试完成 ===")
\ No newline at end of file
@@ -8,14 +8,21 @@
 
 import json
 import os
+
+# 可选的高速JSON编解码器：orjson解析UTF-8 JSON比stdlib快数倍，
+# 未安装时回退到stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from pathlib import Path
 import logging
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterPreset:
     """参数预设"""
     preset_id: str                        # 预设ID
@@ -45,6 +52,20 @@ class ParameterPreset:
     auto_retry_failed: bool = True       # 失败自动重试
     step_delay: int = 500                # 步骤间延时(ms)
 
+    # apply_preset结果的记忆化缓存 (预设对象不可变，替换预设即新对象新缓存)
+    _applied_cache: Optional[Dict[str, Any]] = field(init=False, default=None, repr=False)
+
+    # 类级缓存的字段名元组，通用路径可直接getattr遍历，
+    # 免去每次调用dataclasses.fields()的反射开销
+    _FIELDS = (
+        'preset_id', 'name', 'description', 'is_builtin', 'created_time',
+        'standard_voltage', 'standard_current', 'standard_frequency',
+        'standard_power_factor', 'standard_phase_angle',
+        'no_load_threshold', 'small_current_threshold',
+        'communication_timeout', 'max_retries', 'retry_delay',
+        'selected_steps', 'auto_retry_failed', 'step_delay'
+    )
+
     def __post_init__(self):
         if self.selected_steps is None:
             self.selected_steps = [1, 2, 3, 4, 5]  # 默认全选
@@ -52,8 +73,28 @@ class ParameterPreset:
             self.created_time = datetime.now().isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return asdict(self)
+        """转换为字典 (显式字段访问，避免asdict的递归deepcopy与反射)"""
+        return {
+            'preset_id': self.preset_id,
+            'name': self.name,
+            'description': self.description,
+            'is_builtin': self.is_builtin,
+            'created_time': self.created_time,
+            'standard_voltage': self.standard_voltage,
+            'standard_current': self.standard_current,
+            'standard_frequency': self.standard_frequency,
+            'standard_power_factor': self.standard_power_factor,
+            'standard_phase_angle': self.standard_phase_angle,
+            'no_load_threshold': self.no_load_threshold,
+            'small_current_threshold': self.small_current_threshold,
+            'communication_timeout': self.communication_timeout,
+            'max_retries': self.max_retries,
+            'retry_delay': self.retry_delay,
+            # selected_steps是唯一可变字段，复制一份避免外部改动预设
+            'selected_steps': list(self.selected_steps),
+            'auto_retry_failed': self.auto_retry_failed,
+            'step_delay': self.step_delay
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ParameterPreset':
@@ -61,6 +102,126 @@ class ParameterPreset:
         return cls(**data)
 
 
+# 内置预设的固定时间戳：常量字符串免去构造时的datetime.now()
+_BUILTIN_CREATED_TIME = "2024-01-01T00:00:00"
+
+# 模块级冻结的内置预设：导入时构造一次，所有管理器实例共享 (API层面内置预设只读)
+_BUILTIN_PRESETS = (
+    ParameterPreset(
+        preset_id="default_220v_1a",
+        name="标准220V/1A",
+        description="标准单相电表校表参数：220V/1A/50Hz",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=1.0,
+        standard_frequency=50.0,
+        standard_power_factor=1.0,
+        selected_steps=[1, 2, 3, 4, 5]
+    ),
+
+    ParameterPreset(
+        preset_id="low_current_220v",
+        name="小电流220V/0.1A",
+        description="小电流校表参数：220V/0.1A",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=0.1,
+        standard_frequency=50.0,
+        small_current_threshold=0.01,
+        selected_steps=[1, 5]  # 只校正空载和小电流
+    ),
+
+    ParameterPreset(
+        preset_id="high_current_220v",
+        name="大电流220V/10A",
+        description="大电流校表参数：220V/10A",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=10.0,
+        standard_frequency=50.0,
+        selected_steps=[2, 3, 4]  # 跳过空载和小电流校正
+    ),
+
+    ParameterPreset(
+        preset_id="three_phase_380v",
+        name="三相380V/1A",
+        description="三相电表校表参数：380V/1A/50Hz",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=380.0,
+        standard_current=1.0,
+        standard_frequency=50.0,
+        standard_power_factor=0.8,  # 通常三相负载功率因数
+        selected_steps=[1, 2, 3, 4, 5]
+    ),
+
+    ParameterPreset(
+        preset_id="fast_calibration",
+        name="快速校表",
+        description="快速校表模式，仅校正关键项目",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=1.0,
+        selected_steps=[1, 2, 3],  # 只校正基本项目
+        communication_timeout=2000,  # 更短的超时时间
+        step_delay=200  # 更快的步骤切换
+    ),
+
+    ParameterPreset(
+        preset_id="precision_mode",
+        name="精密校表模式",
+        description="高精度校表，包含所有校正项目",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=1.0,
+        selected_steps=[1, 2, 3, 4, 5],
+        communication_timeout=5000,  # 更长的超时时间
+        max_retries=5,  # 更多重试次数
+        step_delay=1000  # 更多等待时间确保精度
+    ),
+
+    ParameterPreset(
+        preset_id="production_line",
+        name="产线校表",
+        description="产线批量校表优化参数",
+        is_builtin=True,
+        created_time=_BUILTIN_CREATED_TIME,
+        standard_voltage=220.0,
+        standard_current=1.0,
+        selected_steps=[1, 2, 3],  # 关键校正项目
+        communication_timeout=3000,
+        step_delay=500,
+        auto_retry_failed=False  # 产线模式不自动重试，提高效率
+    )
+)
+
+
+# 预设分类位掩码 (bit0=标准 bit1=小电流 bit2=大电流 bit3=三相)
+_CAT_STANDARD = 1
+_CAT_LOW_CURRENT = 2
+_CAT_HIGH_CURRENT = 4
+_CAT_THREE_PHASE = 8
+
+
+def _category_mask(name: str) -> int:
+    """根据预设名称计算分类位掩码 (插入时计算一次，扫描时纯整数运算)"""
+    mask = 0
+    if '220V' in name:
+        mask |= _CAT_STANDARD
+    if '小电流' in name or '0.1A' in name:
+        mask |= _CAT_LOW_CURRENT
+    if '大电流' in name or '10A' in name:
+        mask |= _CAT_HIGH_CURRENT
+    if '三相' in name or '380V' in name:
+        mask |= _CAT_THREE_PHASE
+    return mask
+
+
 class ParameterPresets:
     """参数预设管理器
 
@@ -71,6 +232,17 @@ class ParameterPresets:
     - JSON文件存储
     """
 
+    # 预编译的范围校验表: (属性名, 下限, 上限, 错误消息)
+    _RANGES = (
+        ('standard_voltage', 50.0, 500.0, "标准电压超出范围(50-500V)"),
+        ('standard_current', 0.001, 200.0, "标准电流超出范围(0.001-200A)"),
+        ('standard_frequency', 45.0, 65.0, "标准频率超出范围(45-65Hz)"),
+        ('standard_power_factor', 0.0, 1.0, "功率因数超出范围(0.0-1.0)"),
+        ('standard_phase_angle', -180.0, 180.0, "相位角超出范围(-180到180度)"),
+        ('communication_timeout', 1000, float('inf'), "通信超时时间过短(最少1000ms)"),
+        ('max_retries', 0, float('inf'), "最大重试次数不能为负数"),
+    )
+
     def __init__(self, presets_dir: str = "presets"):
         """初始化参数预设管理器
 
@@ -86,112 +258,61 @@ class ParameterPresets:
         # 预设存储
         self.presets: Dict[str, ParameterPreset] = {}
 
+        # 用户预设延迟加载：仅内置预设随构造就绪，
+        # 首次访问预设时才读盘，免去不使用预设面板时的启动开销
+        self._loaded = False
+
+        # 摘要/列表缓存，预设增删/加载时失效
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._list_cache: Dict[bool, List[Dict[str, Any]]] = {}
+
+        # 列式索引(preset_id, name, is_builtin, 分类掩码)：
+        # 摘要扫描只触达这四列而非完整预设对象，增删后惰性重建
+        self._index: List[tuple] = []
+        self._index_dirty = True
+
         # 初始化预设
         self._init_builtin_presets()
-        self.load_presets()
 
     def _init_builtin_presets(self):
-        """初始化内置预设"""
-        builtin_presets = [
-            ParameterPreset(
-                preset_id="default_220v_1a",
-                name="标准220V/1A",
-                description="标准单相电表校表参数：220V/1A/50Hz",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=1.0,
-                standard_frequency=50.0,
-                standard_power_factor=1.0,
-                selected_steps=[1, 2, 3, 4, 5]
-            ),
-
-            ParameterPreset(
-                preset_id="low_current_220v",
-                name="小电流220V/0.1A",
-                description="小电流校表参数：220V/0.1A",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=0.1,
-                standard_frequency=50.0,
-                small_current_threshold=0.01,
-                selected_steps=[1, 5]  # 只校正空载和小电流
-            ),
-
-            ParameterPreset(
-                preset_id="high_current_220v",
-                name="大电流220V/10A",
-                description="大电流校表参数：220V/10A",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=10.0,
-                standard_frequency=50.0,
-                selected_steps=[2, 3, 4]  # 跳过空载和小电流校正
-            ),
-
-            ParameterPreset(
-                preset_id="three_phase_380v",
-                name="三相380V/1A",
-                description="三相电表校表参数：380V/1A/50Hz",
-                is_builtin=True,
-                standard_voltage=380.0,
-                standard_current=1.0,
-                standard_frequency=50.0,
-                standard_power_factor=0.8,  # 通常三相负载功率因数
-                selected_steps=[1, 2, 3, 4, 5]
-            ),
-
-            ParameterPreset(
-                preset_id="fast_calibration",
-                name="快速校表",
-                description="快速校表模式，仅校正关键项目",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=1.0,
-                selected_steps=[1, 2, 3],  # 只校正基本项目
-                communication_timeout=2000,  # 更短的超时时间
-                step_delay=200  # 更快的步骤切换
-            ),
-
-            ParameterPreset(
-                preset_id="precision_mode",
-                name="精密校表模式",
-                description="高精度校表，包含所有校正项目",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=1.0,
-                selected_steps=[1, 2, 3, 4, 5],
-                communication_timeout=5000,  # 更长的超时时间
-                max_retries=5,  # 更多重试次数
-                step_delay=1000  # 更多等待时间确保精度
-            ),
-
-            ParameterPreset(
-                preset_id="production_line",
-                name="产线校表",
-                description="产线批量校表优化参数",
-                is_builtin=True,
-                standard_voltage=220.0,
-                standard_current=1.0,
-                selected_steps=[1, 2, 3],  # 关键校正项目
-                communication_timeout=3000,
-                step_delay=500,
-                auto_retry_failed=False  # 产线模式不自动重试，提高效率
-            )
-        ]
-
-        for preset in builtin_presets:
+        """初始化内置预设 (共享模块级冻结实例，免去每个管理器的重复构造)"""
+        for preset in _BUILTIN_PRESETS:
             self.presets[preset.preset_id] = preset
 
+    def _ensure_loaded(self):
+        """确保用户预设已从磁盘加载 (首次访问时触发)"""
+        if not self._loaded:
+            self._loaded = True
+            self.load_presets()
+
+    def _get_index(self) -> List[tuple]:
+        """获取列式索引，增删后惰性重建"""
+        if self._index_dirty:
+            self._index = [
+                (p.preset_id, p.name, p.is_builtin, _category_mask(p.name))
+                for p in self.presets.values()
+            ]
+            self._index_dirty = False
+        return self._index
+
     def load_presets(self) -> bool:
         """加载用户自定义预设
 
         Returns:
             是否加载成功
         """
+        self._loaded = True
+        self._summary_cache = None
+        self._list_cache.clear()
+        self._index_dirty = True
         try:
             if self.presets_file.exists():
-                with open(self.presets_file, 'r', encoding='utf-8') as f:
-                    presets_data = json.load(f)
+                # orjson以bytes解析UTF-8，比stdlib json少一次解码与一半分配
+                if orjson is not None:
+                    presets_data = orjson.loads(self.presets_file.read_bytes())
+                else:
+                    with open(self.presets_file, 'r', encoding='utf-8') as f:
+                        presets_data = json.load(f)
 
                 # 加载用户预设（不覆盖内置预设）
                 for preset_id, preset_data in presets_data.items():
@@ -221,8 +342,16 @@ class ParameterPresets:
                 if not preset.is_builtin
             }
 
-            with open(self.presets_file, 'w', encoding='utf-8') as f:
-                json.dump(user_presets, f, indent=2, ensure_ascii=False)
+            # 先写临时文件再原子替换，写入中途崩溃不会截断预设库
+            if orjson is not None:
+                data = orjson.dumps(user_presets, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(user_presets, indent=2,
+                                  ensure_ascii=False).encode('utf-8')
+
+            tmp_file = self.presets_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.presets_file)
 
             self.logger.info(f"保存用户预设: {len(user_presets)}个")
             return True
@@ -238,8 +367,12 @@ class ParameterPresets:
             include_builtin: 是否包含内置预设
 
         Returns:
-            预设信息列表
+            预设信息列表 (缓存共享，调用方应视为只读)
         """
+        self._ensure_loaded()
+        cached = self._list_cache.get(include_builtin)
+        if cached is not None:
+            return cached
         preset_list = []
 
         for preset in self.presets.values():
@@ -259,6 +392,7 @@ class ParameterPresets:
 
         # 按名称排序，内置预设在前
         preset_list.sort(key=lambda x: (not x['is_builtin'], x['name']))
+        self._list_cache[include_builtin] = preset_list
         return preset_list
 
     def get_preset(self, preset_id: str) -> Optional[ParameterPreset]:
@@ -270,6 +404,7 @@ class ParameterPresets:
         Returns:
             预设对象或None
         """
+        self._ensure_loaded()
         return self.presets.get(preset_id)
 
     def save_preset(self, name: str, description: str, parameters: Dict[str, Any],
@@ -285,6 +420,7 @@ class ParameterPresets:
         Returns:
             预设ID
         """
+        self._ensure_loaded()
         if preset_id is None:
             # 生成新的预设ID
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -313,6 +449,9 @@ class ParameterPresets:
 
         # 保存预设
         self.presets[preset_id] = preset
+        self._summary_cache = None
+        self._list_cache.clear()
+        self._index_dirty = True
         self.save_presets()
 
         self.logger.info(f"保存预设: {name} ({preset_id})")
@@ -327,6 +466,7 @@ class ParameterPresets:
         Returns:
             是否删除成功
         """
+        self._ensure_loaded()
         preset = self.presets.get(preset_id)
         if not preset:
             self.logger.warning(f"预设不存在: {preset_id}")
@@ -337,6 +477,9 @@ class ParameterPresets:
             return False
 
         del self.presets[preset_id]
+        self._summary_cache = None
+        self._list_cache.clear()
+        self._index_dirty = True
         self.save_presets()
 
         self.logger.info(f"删除预设: {preset.name} ({preset_id})")
@@ -349,13 +492,19 @@ class ParameterPresets:
             preset_id: 预设ID
 
         Returns:
-            参数字典或None
+            参数字典或None (记忆化共享，调用方应视为只读)
         """
+        self._ensure_loaded()
         preset = self.presets.get(preset_id)
         if not preset:
             self.logger.error(f"预设不存在: {preset_id}")
             return None
 
+        # 重复应用同一预设直接复用缓存的参数字典
+        if preset._applied_cache is not None:
+            self.logger.info(f"应用预设: {preset.name} ({preset_id})")
+            return preset._applied_cache
+
         # 转换为参数字典
         parameters = {
             # 标准值参数
@@ -384,6 +533,7 @@ class ParameterPresets:
             }
         }
 
+        preset._applied_cache = parameters
         self.logger.info(f"应用预设: {preset.name} ({preset_id})")
         return parameters
 
@@ -396,39 +546,16 @@ class ParameterPresets:
         Returns:
             验证结果字典
         """
-        errors = []
-
-        # 验证电压范围
-        if not (50.0 <= preset.standard_voltage <= 500.0):
-            errors.append("标准电压超出范围(50-500V)")
-
-        # 验证电流范围
-        if not (0.001 <= preset.standard_current <= 200.0):
-            errors.append("标准电流超出范围(0.001-200A)")
-
-        # 验证频率范围
-        if not (45.0 <= preset.standard_frequency <= 65.0):
-            errors.append("标准频率超出范围(45-65Hz)")
-
-        # 验证功率因数
-        if not (0.0 <= preset.standard_power_factor <= 1.0):
-            errors.append("功率因数超出范围(0.0-1.0)")
-
-        # 验证相位角
-        if not (-180.0 <= preset.standard_phase_angle <= 180.0):
-            errors.append("相位角超出范围(-180到180度)")
+        # 数值范围检查走预编译表，单循环完成且无每次的f-string构建
+        errors = [
+            msg for attr, low, high, msg in self._RANGES
+            if not (low <= getattr(preset, attr) <= high)
+        ]
 
         # 验证步骤选择
         if not preset.selected_steps or not all(1 <= step <= 5 for step in preset.selected_steps):
             errors.append("选中的步骤无效(必须是1-5之间的数字)")
 
-        # 验证通信参数
-        if preset.communication_timeout < 1000:
-            errors.append("通信超时时间过短(最少1000ms)")
-
-        if preset.max_retries < 0:
-            errors.append("最大重试次数不能为负数")
-
         return {
             'is_valid': len(errors) == 0,
             'errors': errors
@@ -444,6 +571,7 @@ class ParameterPresets:
         Returns:
             是否导出成功
         """
+        self._ensure_loaded()
         preset = self.presets.get(preset_id)
         if not preset:
             self.logger.error(f"预设不存在: {preset_id}")
@@ -470,6 +598,8 @@ class ParameterPresets:
         Returns:
             导入的预设ID或None
         """
+        # 先加载已有用户预设，避免随后的save_presets丢弃磁盘上的预设
+        self._ensure_loaded()
         try:
             with open(import_path, 'r', encoding='utf-8') as f:
                 preset_data = json.load(f)
@@ -494,6 +624,9 @@ class ParameterPresets:
 
             # 保存预设
             self.presets[new_preset_id] = preset
+            self._summary_cache = None
+            self._list_cache.clear()
+            self._index_dirty = True
             self.save_presets()
 
             self.logger.info(f"预设导入成功: {preset.name} ({new_preset_id})")
@@ -509,20 +642,34 @@ class ParameterPresets:
         Returns:
             摘要信息字典
         """
-        builtin_count = len([p for p in self.presets.values() if p.is_builtin])
-        user_count = len([p for p in self.presets.values() if not p.is_builtin])
-
-        return {
+        self._ensure_loaded()
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        # 扫描列式索引：每项只有4列(而非完整预设对象)，分类判断为纯位运算
+        builtin_count = 0
+        standard = low_current = high_current = three_phase = 0
+        index = self._get_index()
+        for _, _, is_builtin, mask in index:
+            builtin_count += is_builtin
+            standard += mask & _CAT_STANDARD
+            low_current += (mask & _CAT_LOW_CURRENT) >> 1
+            high_current += (mask & _CAT_HIGH_CURRENT) >> 2
+            three_phase += (mask & _CAT_THREE_PHASE) >> 3
+        user_count = len(index) - builtin_count
+
+        self._summary_cache = {
             'total_presets': len(self.presets),
             'builtin_presets': builtin_count,
             'user_presets': user_count,
             'preset_categories': {
-                'standard': len([p for p in self.presets.values() if '220V' in p.name]),
-                'low_current': len([p for p in self.presets.values() if '小电流' in p.name or '0.1A' in p.name]),
-                'high_current': len([p for p in self.presets.values() if '大电流' in p.name or '10A' in p.name]),
-                'three_phase': len([p for p in self.presets.values() if '三相' in p.name or '380V' in p.name])
+                'standard': standard,
+                'low_current': low_current,
+                'high_current': high_current,
+                'three_phase': three_phase
             }
         }
+        return self._summary_cache
 
 
 if __name__ == "__main__":
@@ -7,10 +7,13 @@ RN8213/RN8211B 电表校准工具 v2.0 - 串口通信模块
 
 import serial
 import serial.tools.list_ports
+import struct
 import threading
+import queue
 import time
 from typing import List, Optional, Callable
-from PyQt5.QtCore import QObject, pyqtSignal
+from functools import lru_cache
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QCoreApplication
 from enum import Enum
 
 
@@ -24,6 +27,11 @@ class SerialState(Enum):
 
 class SerialConfig:
     """串口配置类"""
+
+    # 固定槽位：免去每实例__dict__，属性访问走C级槽查找
+    __slots__ = ('port', 'baudrate', 'bytesize', 'parity', 'stopbits',
+                 'timeout', 'write_timeout', 'retry_count', 'frame_interval')
+
     def __init__(self):
         self.port = ""                    # 端口名
         self.baudrate = 9600             # 波特率（常用9600）
@@ -72,15 +80,36 @@ class SerialPort(QObject):
     frame_sent = pyqtSignal(bytes)       # 帧发送信号
     frame_received = pyqtSignal(bytes)   # 帧接收信号
 
+    # 内部信号：跨线程请求状态合并发射 (队列连接投递到对象所属线程)
+    _state_dirty = pyqtSignal()
+
+    # 状态合并窗口(ms)：窗口内OPENED→BUSY→OPENED往返只发射最终状态
+    STATE_COALESCE_MS = 1
+
     def __init__(self):
         super().__init__()
         self.config = SerialConfig()
         self.serial_conn: Optional[serial.Serial] = None
         self.state = SerialState.CLOSED
-        self._lock = threading.Lock()
         self.is_reading = False
         self.read_thread: Optional[threading.Thread] = None
 
+        # 无锁发送队列：UI线程只入队即返回，由发送线程串行写出并控制帧间隔
+        self._tx_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.tx_thread: Optional[threading.Thread] = None
+
+        # 接收残留缓冲：批量排空OS缓冲后、组完一帧余下的字节在此
+        # 跨调用保留，同一burst里的背靠背帧下次调用直接从中取
+        self._rx_pending = bytearray()
+
+        # 状态信号合并：微秒级的BUSY往返不触发跨线程的槽执行
+        self._last_emitted_state = self.state
+        self._state_timer = QTimer(self)
+        self._state_timer.setSingleShot(True)
+        self._state_timer.setInterval(self.STATE_COALESCE_MS)
+        self._state_timer.timeout.connect(self._flush_state)
+        self._state_dirty.connect(self._on_state_dirty)
+
     @property
     def serial(self) -> Optional[serial.Serial]:
         """提供对串口连接对象的访问（向后兼容性）"""
@@ -116,15 +145,17 @@ class SerialPort(QObject):
                 write_timeout=self.config.write_timeout
             )
 
-            # 清空缓冲区
+            # 清空缓冲区（含上次会话的接收残留）
             self.serial_conn.reset_input_buffer()
             self.serial_conn.reset_output_buffer()
+            self._rx_pending.clear()
 
             # 更新状态
             self._set_state(SerialState.OPENED)
 
-            # 启动读取线程
+            # 启动读取/发送线程
             self._start_read_thread()
+            self._start_tx_thread()
 
             return True
 
@@ -136,14 +167,16 @@ class SerialPort(QObject):
     def close_port(self) -> bool:
         """关闭串口"""
         try:
-            # 停止读取线程
+            # 停止读取/发送线程
             self._stop_read_thread()
+            self._stop_tx_thread()
 
             # 关闭串口
             if self.serial_conn and self.serial_conn.is_open:
                 self.serial_conn.close()
 
             self.serial_conn = None
+            self._rx_pending.clear()
             self._set_state(SerialState.CLOSED)
             return True
 
@@ -152,32 +185,17 @@ class SerialPort(QObject):
             return False
 
     def send_frame(self, frame_data: bytes) -> bool:
-        """发送帧数据"""
-        if self.state != SerialState.OPENED:
+        """发送帧数据
+
+        仅将帧入无锁队列后立即返回，写出与帧间隔控制由发送线程完成，
+        调用方(通常是UI线程)不再被write/sleep阻塞
+        """
+        if self.state not in (SerialState.OPENED, SerialState.BUSY):
             self.error_occurred.emit("串口未打开")
             return False
 
-        try:
-            with self._lock:
-                self._set_state(SerialState.BUSY)
-
-                # 发送数据
-                self.serial_conn.write(frame_data)
-                self.serial_conn.flush()
-
-                # 发送信号
-                self.frame_sent.emit(frame_data)
-
-                # 等待帧间隔
-                time.sleep(self.config.frame_interval)
-
-                self._set_state(SerialState.OPENED)
-                return True
-
-        except Exception as e:
-            self.error_occurred.emit(f"发送帧失败: {str(e)}")
-            self._set_state(SerialState.ERROR)
-            return False
+        self._tx_queue.put(frame_data)
+        return True
 
     def receive_frame(self, timeout: float = None) -> Optional[bytes]:
         """接收一个完整的DL/T645帧
@@ -195,59 +213,83 @@ class SerialPort(QObject):
             timeout = self.config.timeout
 
         try:
-            # 查找帧起始符 0x68
+            # 批量读取后用bytes.find(C级memchr)定位起始符0x68，
+            # 避免逐字节read(1)的每字节一次syscall开销。
+            # 残留缓冲跨调用保留：一个burst里排空到的第二帧
+            # 留在_rx_pending里，下次调用不读串口直接组帧
             start_time = time.time()
-            while time.time() - start_time < timeout:
-                byte_data = self.serial_conn.read(1)
-                if not byte_data:
-                    continue
-
-                if byte_data == b'\\x68':
-                    # 找到起始符，读取完整帧
-                    frame = self._read_complete_frame(byte_data, timeout - (time.time() - start_time))
+            pending = self._rx_pending
+            while True:
+                # 先消化缓冲区：可能有多个候选起始符，逐个对齐尝试
+                while pending:
+                    idx = pending.find(0x68)
+                    if idx < 0:
+                        # 没有起始符，已扫描的字节全部丢弃
+                        pending.clear()
+                        break
+
+                    del pending[:idx]
+                    length_before = len(pending)
+                    frame = self._read_complete_frame(pending)
                     if frame:
                         self.frame_received.emit(frame)
                         return frame
 
-            return None
+                    # 缓冲区未缩短说明帧尚不完整，等待更多数据；
+                    # 缩短了说明是伪起始符，继续扫描剩余字节
+                    if len(pending) >= length_before:
+                        break
+
+                if time.time() - start_time >= timeout:
+                    return None
+
+                chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+                if chunk:
+                    pending.extend(chunk)
 
         except Exception as e:
             self.error_occurred.emit(f"接收帧失败: {str(e)}")
             return None
 
-    def _read_complete_frame(self, start_byte: bytes, remaining_timeout: float) -> Optional[bytes]:
-        """读取完整的DL/T645帧
+    def _read_complete_frame(self, pending: bytearray) -> Optional[bytes]:
+        """从缓冲区(必要时补读串口)取出完整的DL/T645帧
 
         帧格式: 68 A5..A0 68 C L DATA CS 16
+        pending[0]应为0x68；帧结构无效时丢弃首字节让调用方重新对齐
+        全程在同一bytearray上累积，仅在返回时复制一次完整帧
         """
         try:
-            frame = start_byte  # 0x68
+            def _fill(n: int) -> bool:
+                """补读串口直到缓冲区至少有n字节"""
+                while len(pending) < n:
+                    chunk = self.serial_conn.read(n - len(pending))
+                    if not chunk:
+                        return False
+                    pending.extend(chunk)
+                return True
 
-            # 读取地址（6字节）+ 第二个68 + 控制码 + 长度（共9字节）
-            header = self.serial_conn.read(9)
-            if len(header) != 9:
+            # 头部: 68 + 地址(6字节) + 第二个68 + 控制码 + 长度 (共10字节)
+            if not _fill(10):
                 return None
 
-            frame += header
-
             # 验证第二个起始符
-            if header[6] != 0x68:
+            if pending[7] != 0x68:
+                del pending[:1]  # 丢弃伪起始符，避免重复匹配同一位置
                 return None
 
-            # 获取数据长度
-            data_length = header[8]
-
-            # 读取数据域 + 校验和 + 结束符
-            remaining = self.serial_conn.read(data_length + 2)
-            if len(remaining) != data_length + 2:
+            # 数据域 + 校验和 + 结束符
+            data_length = pending[9]
+            total_length = 10 + data_length + 2
+            if not _fill(total_length):
                 return None
 
-            frame += remaining
-
             # 验证结束符
-            if remaining[-1] != 0x16:
+            if pending[total_length - 1] != 0x16:
+                del pending[:1]
                 return None
 
+            frame = bytes(pending[:total_length])
+            del pending[:total_length]
             return frame
 
         except Exception:
@@ -266,19 +308,70 @@ class SerialPort(QObject):
         """停止读取线程"""
         self.is_reading = False
         if self.read_thread:
+            # 取消阻塞中的read，让线程立即退出而不等超时
+            try:
+                if self.serial_conn and self.serial_conn.is_open:
+                    self.serial_conn.cancel_read()
+            except Exception:
+                pass
             self.read_thread.join(timeout=1.0)
             self.read_thread = None
 
+    def _start_tx_thread(self):
+        """启动发送线程"""
+        if self.tx_thread is not None:
+            return
+
+        self.tx_thread = threading.Thread(target=self._tx_worker, daemon=True)
+        self.tx_thread.start()
+
+    def _stop_tx_thread(self):
+        """停止发送线程"""
+        if self.tx_thread:
+            self._tx_queue.put(None)  # 哨兵值唤醒并结束线程
+            self.tx_thread.join(timeout=1.0)
+            self.tx_thread = None
+
+    def _tx_worker(self):
+        """发送工作线程：从队列取帧串行写出，并保持帧间隔节奏"""
+        while True:
+            frame_data = self._tx_queue.get()
+            if frame_data is None:
+                break
+
+            try:
+                self._set_state(SerialState.BUSY)
+
+                self.serial_conn.write(frame_data)
+                self.serial_conn.flush()
+                self.frame_sent.emit(frame_data)
+
+                # 等待帧间隔
+                time.sleep(self.config.frame_interval)
+
+                self._set_state(SerialState.OPENED)
+
+            except Exception as e:
+                self.error_occurred.emit(f"发送帧失败: {str(e)}")
+                self._set_state(SerialState.ERROR)
+                break
+
     def _read_worker(self):
-        """读取工作线程"""
+        """读取工作线程
+
+        阻塞式read(1)由内核在有数据到达时唤醒线程，
+        替代每10ms轮询in_waiting的忙等，空闲时CPU占用趋近于零
+        """
         while self.is_reading and self.serial_conn and self.serial_conn.is_open:
             try:
-                if self.serial_conn.in_waiting > 0:
-                    data = self.serial_conn.read(self.serial_conn.in_waiting)
-                    if data:
-                        self.data_received.emit(data)
-
-                time.sleep(0.01)  # 小延时避免过度占用CPU
+                # 阻塞等待首字节 (最长等待配置的timeout)
+                data = self.serial_conn.read(1)
+                if data:
+                    # 一次排空缓冲区中已到达的剩余字节
+                    waiting = self.serial_conn.in_waiting
+                    if waiting:
+                        data += self.serial_conn.read(waiting)
+                    self.data_received.emit(data)
 
             except Exception as e:
                 if self.is_reading:  # 只有在读取标志为True时才报告错误
@@ -286,10 +379,27 @@ class SerialPort(QObject):
                 break
 
     def _set_state(self, new_state: SerialState):
-        """设置串口状态"""
-        if self.state != new_state:
-            self.state = new_state
-            self.state_changed.emit(new_state.value)
+        """设置串口状态 (发射经过合并，瞬时往返不惊动UI线程)"""
+        if self.state == new_state:
+            return
+        self.state = new_state
+
+        if QCoreApplication.instance() is None:
+            # 无事件循环(脚本/测试环境)时退化为同步发射
+            self._flush_state()
+        else:
+            self._state_dirty.emit()
+
+    def _on_state_dirty(self):
+        """在对象所属线程中启动合并定时器"""
+        if not self._state_timer.isActive():
+            self._state_timer.start()
+
+    def _flush_state(self):
+        """合并窗口结束后发射最终状态 (往返回原状态则不发射)"""
+        if self._last_emitted_state != self.state:
+            self._last_emitted_state = self.state
+            self.state_changed.emit(self.state.value)
 
     def get_state(self) -> SerialState:
         """获取当前状态"""
@@ -307,6 +417,13 @@ class SerialPort(QObject):
             return str(self.config)
 
 
+# 十六进制字符串清洗用的删除表，一次translate去掉所有分隔符
+_HEX_DEL_TABLE = str.maketrans('', '', ' -:\t\r\n')
+
+# 预计算的+0x33偏置转换表：bytes.translate一次C调用完成整个数据域偏置
+_ADD_0X33_TABLE = bytes((b + 0x33) & 0xFF for b in range(256))
+
+
 def hex_string_to_bytes(hex_str: str) -> bytes:
     """将十六进制字符串转换为字节数组
 
@@ -316,8 +433,8 @@ def hex_string_to_bytes(hex_str: str) -> bytes:
     Returns:
         对应的字节数组
     """
-    # 移除空格和其他分隔符
-    hex_str = hex_str.replace(' ', '').replace('-', '').replace(':', '')
+    # 移除空格和其他分隔符 (单次C级扫描)
+    hex_str = hex_str.translate(_HEX_DEL_TABLE)
 
     # 确保长度为偶数
     if len(hex_str) % 2 != 0:
@@ -337,9 +454,26 @@ def bytes_to_hex_string(data: bytes, separator: str = ' ') -> str:
     Returns:
         十六进制字符串
     """
+    # C级bytes.hex(sep)快路径；多字符分隔符不被hex()支持，回退逐字节拼接
+    if not separator:
+        return data.hex().upper()
+    if len(separator) == 1:
+        return data.hex(separator).upper()
     return separator.join(f'{b:02X}' for b in data)
 
 
+@lru_cache(maxsize=32)
+def _addr_prefix(address: str, control_code: int) -> bytes:
+    """帧头8字节 (68 + 地址逆序 + 68 + 控制码)，按地址/控制码缓存
+
+    重复使用默认地址时跳过每次的fromhex解析与逐段拼接
+    """
+    addr_bytes = bytes.fromhex(address)
+    if len(addr_bytes) != 6:
+        addr_bytes = b'\x11\x11\x11\x11\x11\x11'  # 默认地址
+    return b'\x68' + addr_bytes[::-1] + b'\x68' + bytes([control_code])
+
+
 def calculate_checksum(frame_data: bytes) -> int:
     """计算DL/T645校验和
 
@@ -369,42 +503,23 @@ def build_dlt645_frame(address: str = "111111111111",
     Returns:
         完整的DL/T645帧字节数组
     """
-    # 起始符
-    frame = bytearray([0x68])
-
-    # 地址域(6字节，低位在前)
-    addr_bytes = bytes.fromhex(address)
-    if len(addr_bytes) == 6:
-        # 逆序：低位在前
-        frame.extend(addr_bytes[::-1])
-    else:
-        # 默认地址
-        frame.extend([0x11, 0x11, 0x11, 0x11, 0x11, 0x11])
-
-    # 第二个起始符
-    frame.append(0x68)
-
-    # 控制码
-    frame.append(control_code)
-
-    # 如果有数据域，添加数据
+    # 预分配整帧缓冲区一次写满，免去逐段append/extend的增长与重分配
+    data_len = len(data_field)
+    total_length = 12 + data_len  # 头部9 + 长度1 + 数据域 + 校验和1 + 结束符1
+    frame = bytearray(total_length)
+
+    # 预组装的帧头 (起始符 + 地址逆序 + 第二个起始符 + 控制码，共9字节)
+    frame[:9] = _addr_prefix(address, control_code)
+    frame[9] = data_len
     if data_field:
-        # 数据长度
-        frame.append(len(data_field))
-
-        # 数据域
-        frame.extend(data_field)
-    else:
-        # 无数据
-        frame.append(0x00)
+        frame[10:10 + data_len] = data_field
 
-    # 计算校验和(从第二个0x68开始)
-    checksum_data = frame[7:]  # 从索引7(第二个0x68)开始
-    checksum = calculate_checksum(checksum_data)
-    frame.append(checksum)
+    # 计算校验和(从第二个0x68开始)，memoryview切片避免复制
+    frame[total_length - 2] = calculate_checksum(
+        memoryview(frame)[7:total_length - 2])
 
     # 结束符
-    frame.append(0x16)
+    frame[total_length - 1] = 0x16
 
     return bytes(frame)
 
@@ -433,24 +548,16 @@ def build_calibration_frame(step_id: int, standard_voltage: float = 220.0,
     # 获取数据标识
     data_id = step_data_ids.get(step_id, "00F81500")
 
-    # 构建数据域：数据标识 + 参数值(模拟)
-    data_field = bytearray()
-
-    # 数据标识(4字节，需要+0x33偏置)
-    di_bytes = bytes.fromhex(data_id)
-    for b in di_bytes:
-        data_field.append((b + 0x33) & 0xFF)
-
-    # 添加4字节参数数据(模拟标准值编码)
+    # 构建数据域：数据标识 + 参数值(模拟标准值编码)
+    # +0x33偏置通过预计算转换表一次C调用完成，替代逐字节Python循环
     voltage_encoded = int(standard_voltage * 100) & 0xFFFF
     current_encoded = int(standard_current * 100) & 0xFFFF
 
-    data_field.append(((voltage_encoded & 0xFF) + 0x33) & 0xFF)
-    data_field.append(((voltage_encoded >> 8) + 0x33) & 0xFF)
-    data_field.append(((current_encoded & 0xFF) + 0x33) & 0xFF)
-    data_field.append(((current_encoded >> 8) + 0x33) & 0xFF)
+    data_field = (bytes.fromhex(data_id)
+                  + struct.pack('<HH', voltage_encoded, current_encoded)
+                  ).translate(_ADD_0X33_TABLE)
 
-    return build_dlt645_frame(data_field=bytes(data_field))
+    return build_dlt645_frame(data_field=data_field)
 
 
 
@@ -7,15 +7,61 @@
 """
 
 import json
+import mmap
 import os
+import re
 import csv
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime, date
 from pathlib import Path
 import logging
 from enum import Enum
 
+try:
+    import zstandard
+except ImportError:  # zstd不可用时回退明文JSON存储
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:  # orjson可直接解析缓冲区对象，未安装时回退标准库
+    orjson = None
+
+
+# 小于一页的文件mmap建立开销占主导，仍走普通read
+_MMAP_MIN_SIZE = 4096
+
+# 步骤WAL缓冲超过该字节数才落盘，把大量小写合并为少数顺序大写
+_WAL_FLUSH_BYTES = 65536
+
+# 按年月组织的记录子目录名
+_MONTH_DIR_RE = re.compile(r'\d{4}-\d{2}')
+
+
+def _dumps_json(data: Dict[str, Any]) -> bytes:
+    """序列化为UTF-8 JSON字节，优先orjson（直接产出bytes，免编码一步）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _dumps_json_compact(data: Dict[str, Any]) -> bytes:
+    """序列化为单行紧凑JSON字节（NDJSON索引行）"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def _loads_json(buf) -> Dict[str, Any]:
+    """从bytes或缓冲区对象解析JSON，优先orjson（零拷贝接受memoryview）"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    if not isinstance(buf, (str, bytes, bytearray)):
+        buf = bytes(buf)
+    return json.loads(buf)
+
 
 class SessionStatus(Enum):
     """会话状态"""
@@ -25,6 +71,10 @@ class SessionStatus(Enum):
     FAILED = "failed"             # 失败
 
 
+# 状态值字符串到枚举的预计算映射（Enum构造每次线性扫描成员，dict直查O(1)）
+_STATUS_BY_VALUE = {status.value: status for status in SessionStatus}
+
+
 @dataclass
 class StepRecord:
     """步骤记录"""
@@ -40,8 +90,38 @@ class StepRecord:
     parameters: Optional[Dict] = None         # 执行参数
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        return asdict(self)
+        """转换为字典（浅拷贝__dict__，避开asdict的递归isinstance开销）"""
+        return dict(self.__dict__)
+
+
+# 步骤字段顺序（列式存储按此顺序输出，保持跨会话稳定以利压缩匹配）
+_STEP_FIELDS = tuple(f.name for f in fields(StepRecord))
+
+# 步骤数超过该阈值时改用列式存储，省去逐行重复的字段名
+_STEP_COLUMNAR_THRESHOLD = 8
+
+# StepRecord空闲池：长会话高频产生即用即弃的记录对象，
+# 会话保存后回收复用，减少分配器压力
+_STEP_POOL: List['StepRecord'] = []
+_STEP_POOL_MAX = 256
+
+
+def _new_step_record(**kwargs) -> 'StepRecord':
+    """创建StepRecord，优先复用空闲池中的实例"""
+    if _STEP_POOL:
+        record = _STEP_POOL.pop()
+        for name in _STEP_FIELDS:
+            record.__dict__[name] = None
+        record.__dict__.update(kwargs)
+        return record
+    return StepRecord(**kwargs)
+
+
+def _recycle_step_records(steps: List['StepRecord']):
+    """把序列化完毕、不再被引用的记录放回空闲池"""
+    free = _STEP_POOL_MAX - len(_STEP_POOL)
+    if free > 0:
+        _STEP_POOL.extend(steps[:free])
 
 
 @dataclass
@@ -73,9 +153,25 @@ class CalibrationSession:
             self.steps = []
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
-        data = asdict(self)
+        """转换为字典
+
+        直接用__dict__构建，避开asdict对每个字段的递归isinstance检查；
+        步骤较多时以列式 (steps_columnar) 输出并行列表，
+        避免逐行重复字段名，序列化体积更小且更利于压缩
+        """
+        data = dict(self.__dict__)
         data['status'] = self.status.value
+        if len(self.steps) > _STEP_COLUMNAR_THRESHOLD:
+            del data['steps']
+            data['steps_columnar'] = {
+                name: [getattr(step, name) for step in self.steps]
+                for name in _STEP_FIELDS
+            }
+        else:
+            steps = [None] * len(self.steps)
+            for i, step in enumerate(self.steps):
+                steps[i] = dict(step.__dict__)
+            data['steps'] = steps
         return data
 
 
@@ -104,9 +200,34 @@ class SessionRecorder:
 
         self.logger = logging.getLogger("SessionRecorder")
 
+        # 追加式会话摘要索引，最近会话列表只读索引尾部而非全目录扫描
+        # （单一NDJSON文件优于每会话sidecar摘要：列取N条只开1个文件而非N个）
+        self.index_file = self.records_dir / "index.ndjson"
+
+        # zstd压缩/解压上下文（复用实例，避免每次读写重建）
+        if zstandard is not None:
+            self._cctx = zstandard.ZstdCompressor(level=3)
+            self._dctx = zstandard.ZstdDecompressor()
+        else:
+            self._cctx = None
+            self._dctx = None
+
         # 当前活跃会话
         self.current_session: Optional[CalibrationSession] = None
 
+        # 当前会话的步骤索引 (step_id -> StepRecord) 与增量统计计数
+        self._step_index: Dict[str, StepRecord] = {}
+        self._ok_count = 0
+        self._fail_count = 0
+
+        # 步骤WAL写缓冲：步骤记录先攒在内存，超阈值或会话结束时一次性追加
+        self._pending = bytearray()
+        self._pending_count = 0
+        self._wal_file: Optional[Path] = None
+
+        # 上次运行若异常退出会留下WAL，恢复为interrupted会话
+        self._recover_wal_files()
+
     def start_session(self, session_config: Optional[Dict] = None) -> str:
         """开始新的校表会话
 
@@ -137,6 +258,18 @@ class SessionRecorder:
             self.current_session.standard_values = session_config.get('standard_values')
             self.current_session.device_info = session_config.get('device_info')
 
+        # 按step_id索引步骤记录，查找O(1)（steps列表保持插入顺序）
+        self._step_index = {}
+
+        # 增量统计计数器，每步O(1)更新，免去逐步全表重算
+        self._ok_count = 0
+        self._fail_count = 0
+
+        # 为新会话准备WAL（崩溃时可从中恢复步骤记录）
+        self._wal_file = self.current_month_dir / f"{session_id}.wal"
+        self._pending.clear()
+        self._pending_count = 0
+
         self.logger.info(f"开始校表会话: {session_id}")
         return session_id
 
@@ -161,16 +294,18 @@ class SessionRecorder:
             self.logger.error("没有活跃的校表会话")
             return
 
-        # 查找是否已有该步骤记录
-        existing_step = None
-        for step in self.current_session.steps:
-            if step.step_id == step_id:
-                existing_step = step
-                break
+        # 每次调用只取一次时间戳（两处使用同一值，省一次系统调用和格式化）
+        now_iso = datetime.now().isoformat()
+
+        # 查找是否已有该步骤记录（dict索引，O(1)）
+        existing_step = self._step_index.get(step_id)
 
         if existing_step:
-            # 更新现有记录
-            existing_step.end_time = datetime.now().isoformat()
+            # 更新现有记录：先按旧状态回退计数，再按新状态累加
+            old_status = existing_step.status
+            self._ok_count -= old_status == "success"
+            self._fail_count -= old_status == "failed"
+            existing_step.end_time = now_iso
             existing_step.status = status
             existing_step.correction_value = correction_value
             existing_step.execution_time = execution_time
@@ -178,13 +313,13 @@ class SessionRecorder:
             if parameters:
                 existing_step.parameters = parameters
         else:
-            # 创建新的步骤记录
-            step_record = StepRecord(
+            # 创建新的步骤记录（优先复用空闲池实例）
+            step_record = _new_step_record(
                 step_id=step_id,
                 step_name=step_name,
                 di_code=di_code,
-                start_time=datetime.now().isoformat(),
-                end_time=datetime.now().isoformat(),
+                start_time=now_iso,
+                end_time=now_iso,
                 status=status,
                 correction_value=correction_value,
                 execution_time=execution_time,
@@ -192,9 +327,24 @@ class SessionRecorder:
                 parameters=parameters
             )
             self.current_session.steps.append(step_record)
-
-        # 更新会话统计
-        self._update_session_statistics()
+            self._step_index[step_id] = step_record
+
+        # O(1)增量更新会话统计（end_session时仍做一次全量重算兜底）
+        self._ok_count += status == "success"
+        self._fail_count += status == "failed"
+        session = self.current_session
+        session.total_steps = len(session.steps)
+        session.successful_steps = self._ok_count
+        session.failed_steps = self._fail_count
+        if session.total_steps > 0:
+            session.success_rate = self._ok_count / session.total_steps * 100
+
+        # 追加到WAL缓冲；同一步骤重试会产生多行，恢复时按step_id保留最后一行
+        record = existing_step if existing_step else step_record
+        self._pending += _dumps_json_compact(record.to_dict()) + b'\n'
+        self._pending_count += 1
+        if len(self._pending) > _WAL_FLUSH_BYTES:
+            self._flush_wal()
 
         self.logger.debug(f"记录步骤结果: {step_id} - {status}")
 
@@ -231,14 +381,8 @@ class SessionRecorder:
             # 设置结束时间和状态
             self.current_session.end_time = datetime.now().isoformat()
 
-            if final_status == "completed":
-                self.current_session.status = SessionStatus.COMPLETED
-            elif final_status == "interrupted":
-                self.current_session.status = SessionStatus.INTERRUPTED
-            elif final_status == "failed":
-                self.current_session.status = SessionStatus.FAILED
-            else:
-                self.current_session.status = SessionStatus.COMPLETED
+            self.current_session.status = _STATUS_BY_VALUE.get(
+                final_status, SessionStatus.COMPLETED)
 
             # 添加总结
             if summary:
@@ -252,12 +396,17 @@ class SessionRecorder:
             # 更新统计信息
             self._update_session_statistics()
 
-            # 保存会话记录
+            # 先把WAL缓冲落盘并fsync，再写合并后的会话文件
+            self._flush_wal(sync=True)
             success = self._save_session()
 
             if success:
+                self._discard_wal()
                 self.logger.info(f"会话结束: {self.current_session.session_id} ({final_status})")
+                # 会话已落盘且即将丢弃引用，步骤实例可安全回收
+                _recycle_step_records(self.current_session.steps)
                 self.current_session = None
+                self._step_index.clear()
                 return True
             else:
                 self.logger.error("会话保存失败")
@@ -272,36 +421,225 @@ class SessionRecorder:
         if not self.current_session:
             return
 
+        # 单次无分支遍历：bool直接作0/1累加，不构建临时列表
+        successful = failed = 0
+        for step in self.current_session.steps:
+            successful += step.status == "success"
+            failed += step.status == "failed"
+
         self.current_session.total_steps = len(self.current_session.steps)
-        self.current_session.successful_steps = len([
-            step for step in self.current_session.steps if step.status == "success"
-        ])
-        self.current_session.failed_steps = len([
-            step for step in self.current_session.steps if step.status == "failed"
-        ])
+        self.current_session.successful_steps = successful
+        self.current_session.failed_steps = failed
 
         if self.current_session.total_steps > 0:
             self.current_session.success_rate = (
                 self.current_session.successful_steps / self.current_session.total_steps * 100
             )
 
+    def _flush_wal(self, sync: bool = False):
+        """把步骤缓冲一次性追加到WAL文件
+
+        Args:
+            sync: 是否fsync落盘（仅会话结束时需要）
+        """
+        if not self._pending or self._wal_file is None:
+            return
+        try:
+            with open(self._wal_file, 'ab') as f:
+                f.write(self._pending)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._pending.clear()
+            self._pending_count = 0
+        except Exception as e:
+            self.logger.warning(f"写入WAL失败: {e}")
+
+    def _discard_wal(self):
+        """会话文件写成后丢弃WAL"""
+        self._pending.clear()
+        self._pending_count = 0
+        if self._wal_file is not None and self._wal_file.exists():
+            try:
+                self._wal_file.unlink()
+            except OSError as e:
+                self.logger.warning(f"删除WAL失败: {e}")
+        self._wal_file = None
+
+    def _month_dirs(self, reverse: bool = False) -> List[os.DirEntry]:
+        """列出年月子目录
+
+        os.scandir返回带缓存stat的DirEntry，比glob少一次每项stat
+        """
+        with os.scandir(self.records_dir) as it:
+            dirs = [e for e in it
+                    if _MONTH_DIR_RE.fullmatch(e.name) and e.is_dir()]
+        dirs.sort(key=lambda e: e.name, reverse=reverse)
+        return dirs
+
+    def _recover_wal_files(self):
+        """启动时把遗留WAL恢复为interrupted会话（上次运行异常退出）"""
+        for month_entry in self._month_dirs():
+            month_dir = Path(month_entry.path)
+            with os.scandir(month_entry.path) as it:
+                wal_files = [Path(e.path) for e in it
+                             if e.name.startswith('session_')
+                             and e.name.endswith('.wal')]
+            for wal_file in wal_files:
+                try:
+                    steps: Dict[str, StepRecord] = {}
+                    for line in wal_file.read_bytes().splitlines():
+                        if not line:
+                            continue
+                        step = StepRecord(**_loads_json(line))
+                        steps[step.step_id] = step  # 同一步骤保留最后一行
+
+                    session = CalibrationSession(
+                        session_id=wal_file.stem,
+                        start_time=min(
+                            (s.start_time for s in steps.values()),
+                            default=datetime.now().isoformat()),
+                        end_time=datetime.now().isoformat(),
+                        status=SessionStatus.INTERRUPTED,
+                        notes="由WAL恢复的中断会话"
+                    )
+                    session.steps = list(steps.values())
+                    session.total_steps = len(session.steps)
+                    session.successful_steps = len(
+                        [s for s in session.steps if s.status == "success"])
+                    session.failed_steps = len(
+                        [s for s in session.steps if s.status == "failed"])
+                    if session.total_steps > 0:
+                        session.success_rate = (
+                            session.successful_steps / session.total_steps * 100)
+
+                    self._write_session_file(session, month_dir)
+                    self._append_index(session.to_dict())
+                    wal_file.unlink()
+                    self.logger.warning(f"已从WAL恢复中断会话: {session.session_id}")
+                except Exception as e:
+                    self.logger.error(f"恢复WAL失败 {wal_file}: {e}")
+
+    def _write_session_file(self, session: CalibrationSession,
+                            month_dir: Path) -> Path:
+        """把会话写入指定月份目录，返回文件路径"""
+        payload = _dumps_json(session.to_dict())
+
+        # 会话JSON键名高度重复，zstd可压缩5-10倍，显著减少磁盘读写量
+        if self._cctx is not None:
+            session_file = month_dir / f"{session.session_id}.json.zst"
+            payload = self._cctx.compress(payload)
+        else:
+            session_file = month_dir / f"{session.session_id}.json"
+
+        session_file.write_bytes(payload)
+        return session_file
+
     def _save_session(self) -> bool:
         """保存会话记录到文件"""
         if not self.current_session:
             return False
 
         try:
-            session_file = self.current_month_dir / f"{self.current_session.session_id}.json"
-
-            with open(session_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_session.to_dict(), f, indent=2, ensure_ascii=False)
-
+            self._write_session_file(self.current_session, self.current_month_dir)
+            self._append_index(self.current_session.to_dict())
             return True
 
         except Exception as e:
             self.logger.error(f"保存会话记录失败: {e}")
             return False
 
+    @staticmethod
+    def _session_summary(session_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """从完整会话字典提取摘要字段（索引与列表共用同一结构）"""
+        return {
+            'session_id': session_dict['session_id'],
+            'start_time': session_dict['start_time'],
+            'end_time': session_dict.get('end_time'),
+            'status': session_dict['status'],
+            'total_steps': session_dict.get('total_steps', 0),
+            'successful_steps': session_dict.get('successful_steps', 0),
+            'success_rate': session_dict.get('success_rate', 0.0),
+            'total_duration': session_dict.get('total_duration')
+        }
+
+    def _append_index(self, session_dict: Dict[str, Any]):
+        """向摘要索引追加一行；索引只是加速结构，失败不影响保存结果"""
+        try:
+            line = _dumps_json_compact(self._session_summary(session_dict))
+            with open(self.index_file, 'ab') as f:
+                f.write(line + b'\n')
+        except Exception as e:
+            self.logger.warning(f"更新会话索引失败: {e}")
+
+    def _rebuild_index(self):
+        """索引缺失时全目录扫描重建一次（旧记录升级路径）"""
+        entries = []
+        for month_entry in self._month_dirs():
+            with os.scandir(month_entry.path) as it:
+                session_files = sorted(
+                    (Path(e.path) for e in it
+                     if e.name.startswith('session_')
+                     and e.name.endswith(('.json', '.json.zst'))),
+                    key=lambda p: p.name)
+            for session_file in session_files:
+                try:
+                    entries.append(self._session_summary(
+                        self._read_session_file(session_file)))
+                except Exception as e:
+                    self.logger.warning(f"读取会话文件失败 {session_file}: {e}")
+
+        payload = b''.join(_dumps_json_compact(e) + b'\n' for e in entries)
+        tmp_file = self.index_file.with_suffix('.ndjson.tmp')
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.index_file)
+
+    def _read_index_tail(self, limit: int) -> List[bytes]:
+        """从索引文件末尾倒读至少limit行，避免读入整个索引"""
+        with open(self.index_file, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            data = b''
+            # 多读一行余量，首个分块可能截断半行
+            while pos > 0 and data.count(b'\n') <= limit:
+                step = min(_MMAP_MIN_SIZE, pos)
+                pos -= step
+                f.seek(pos)
+                data = f.read(step) + data
+        lines = data.splitlines()
+        if pos > 0:
+            lines = lines[1:]  # 丢弃可能被截断的首行
+        return lines
+
+    def _read_session_file(self, session_file: Path) -> Dict[str, Any]:
+        """读取会话记录文件，按后缀自动解压zstd压缩记录
+
+        超过一页的文件走mmap零拷贝读取，解压/解析直接以映射区为源，
+        重复列取可命中OS页缓存而无需再次整文件memcpy
+        """
+        is_zst = session_file.suffix == '.zst'
+        if is_zst and self._dctx is None:
+            raise RuntimeError(f"未安装zstandard，无法读取压缩记录: {session_file}")
+
+        if session_file.stat().st_size < _MMAP_MIN_SIZE:
+            payload = session_file.read_bytes()
+            if is_zst:
+                payload = self._dctx.decompress(payload)
+            return _loads_json(payload)
+
+        with open(session_file, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if is_zst:
+                    return _loads_json(self._dctx.decompress(mm))
+                view = memoryview(mm)
+                try:
+                    return _loads_json(view)
+                finally:
+                    view.release()
+            finally:
+                mm.close()
+
     def load_session(self, session_id: str) -> Optional[CalibrationSession]:
         """加载指定会话记录
 
@@ -312,32 +650,45 @@ class SessionRecorder:
             会话对象或None
         """
         try:
-            # 在当前月份目录查找
-            session_file = self.current_month_dir / f"{session_id}.json"
-
-            if not session_file.exists():
-                # 在所有月份目录查找
-                for month_dir in self.records_dir.glob("????-??"):
-                    session_file = month_dir / f"{session_id}.json"
-                    if session_file.exists():
+            # 优先当前月份目录，再按时间倒序查其余月份；兼容压缩与明文两种后缀
+            search_dirs = [self.current_month_dir]
+            search_dirs.extend(
+                Path(e.path) for e in self._month_dirs(reverse=True))
+
+            session_file = None
+            for month_dir in search_dirs:
+                for suffix in ('.json.zst', '.json'):
+                    candidate = month_dir / f"{session_id}{suffix}"
+                    if candidate.exists():
+                        session_file = candidate
                         break
-                else:
-                    return None
+                if session_file is not None:
+                    break
 
-            with open(session_file, 'r', encoding='utf-8') as f:
-                session_dict = json.load(f)
-
-            # 重构会话对象
-            session = CalibrationSession(**{
-                k: v for k, v in session_dict.items()
-                if k not in ['status', 'steps']
-            })
-            session.status = SessionStatus(session_dict['status'])
+            if session_file is None:
+                return None
 
-            # 重构步骤记录
-            session.steps = [
-                StepRecord(**step_dict) for step_dict in session_dict.get('steps', [])
-            ]
+            session_dict = self._read_session_file(session_file)
+
+            # 重构会话对象：pop出特殊键后直接用余下字典做kwargs，
+            # 省去逐键成员测试的字典推导
+            status_str = session_dict.pop('status')
+            steps_data = session_dict.pop('steps', [])
+            step_cols = session_dict.pop('steps_columnar', None)
+            session = CalibrationSession(**session_dict)
+            session.status = _STATUS_BY_VALUE[status_str]
+
+            # 重构步骤记录（列式存储按列zip还原，行式保持原逻辑）
+            if step_cols:
+                names = list(step_cols.keys())
+                session.steps = [
+                    StepRecord(**dict(zip(names, row)))
+                    for row in zip(*step_cols.values())
+                ]
+            else:
+                session.steps = [
+                    StepRecord(**step_dict) for step_dict in steps_data
+                ]
 
             return session
 
@@ -357,32 +708,27 @@ class SessionRecorder:
         sessions = []
 
         try:
-            # 收集所有会话文件
-            session_files = []
-            for month_dir in sorted(self.records_dir.glob("????-??"), reverse=True):
-                for session_file in sorted(month_dir.glob("session_*.json"), reverse=True):
-                    session_files.append(session_file)
-
-            # 加载会话摘要
-            for session_file in session_files[:limit]:
+            # 索引缺失时（旧记录目录）全量扫描重建一次
+            if not self.index_file.exists():
+                self._rebuild_index()
+
+            # 倒读索引尾部：一次seek加小块读取，不随历史会话数线性增长
+            seen = set()
+            for line in reversed(self._read_index_tail(limit)):
+                if not line:
+                    continue
                 try:
-                    with open(session_file, 'r', encoding='utf-8') as f:
-                        session_dict = json.load(f)
-
-                    sessions.append({
-                        'session_id': session_dict['session_id'],
-                        'start_time': session_dict['start_time'],
-                        'end_time': session_dict.get('end_time'),
-                        'status': session_dict['status'],
-                        'total_steps': session_dict.get('total_steps', 0),
-                        'successful_steps': session_dict.get('successful_steps', 0),
-                        'success_rate': session_dict.get('success_rate', 0.0),
-                        'total_duration': session_dict.get('total_duration')
-                    })
-
+                    entry = _loads_json(line)
                 except Exception as e:
-                    self.logger.warning(f"读取会话文件失败 {session_file}: {e}")
+                    self.logger.warning(f"解析索引行失败: {e}")
                     continue
+                # 同一会话ID重复保存时只保留最新一条
+                if entry['session_id'] in seen:
+                    continue
+                seen.add(entry['session_id'])
+                sessions.append(entry)
+                if len(sessions) >= limit:
+                    break
 
         except Exception as e:
             self.logger.error(f"获取会话列表失败: {e}")
@@ -423,58 +769,68 @@ class SessionRecorder:
             return None
 
     def _export_to_text(self, session: CalibrationSession, export_dir: Path) -> str:
-        """导出为文本格式"""
-        export_file = export_dir / f"{session.session_id}_report.txt"
+        """导出为文本格式
 
-        with open(export_file, 'w', encoding='utf-8') as f:
-            f.write("=" * 60 + "\n")
-            f.write("电表校准会话报告\n")
-            f.write("=" * 60 + "\n\n")
+        报告内容先在列表中拼好，最后一次性写出，
+        避免每步骤多次小写穿越写缓冲
+        """
+        export_file = export_dir / f"{session.session_id}_report.txt"
 
+        parts = [
+            "=" * 60 + "\n",
+            "电表校准会话报告\n",
+            "=" * 60 + "\n\n",
             # 会话信息
-            f.write("会话信息:\n")
-            f.write(f"  会话ID: {session.session_id}\n")
-            f.write(f"  开始时间: {session.start_time}\n")
-            f.write(f"  结束时间: {session.end_time or '未结束'}\n")
-            f.write(f"  状态: {session.status.value}\n")
-            f.write(f"  总耗时: {session.total_duration:.2f}秒\n" if session.total_duration else "  总耗时: 未知\n")
-            f.write(f"  成功率: {session.success_rate:.1f}%\n\n")
-
-            # 配置信息
-            if session.serial_config:
-                f.write("串口配置:\n")
-                for key, value in session.serial_config.items():
-                    f.write(f"  {key}: {value}\n")
-                f.write("\n")
-
-            if session.standard_values:
-                f.write("标准值配置:\n")
-                for key, value in session.standard_values.items():
-                    f.write(f"  {key}: {value}\n")
-                f.write("\n")
-
-            # 步骤详情
-            f.write("步骤执行详情:\n")
-            f.write("-" * 60 + "\n")
-            for i, step in enumerate(session.steps, 1):
-                f.write(f"{i}. {step.step_name} ({step.step_id})\n")
-                f.write(f"   DI码: {step.di_code}\n")
-                f.write(f"   状态: {step.status}\n")
-                f.write(f"   执行时间: {step.execution_time:.2f}秒\n" if step.execution_time else "   执行时间: 未知\n")
-                if step.correction_value is not None:
-                    f.write(f"   校正值: {step.correction_value:+.2f}%\n")
-                if step.error_message:
-                    f.write(f"   错误信息: {step.error_message}\n")
-                f.write("\n")
-
-            # 备注
-            if session.notes:
-                f.write("备注信息:\n")
-                f.write(session.notes)
-                f.write("\n\n")
-
-            f.write("=" * 60 + "\n")
-            f.write(f"报告生成时间: {datetime.now().isoformat()}\n")
+            "会话信息:\n",
+            f"  会话ID: {session.session_id}\n",
+            f"  开始时间: {session.start_time}\n",
+            f"  结束时间: {session.end_time or '未结束'}\n",
+            f"  状态: {session.status.value}\n",
+            f"  总耗时: {session.total_duration:.2f}秒\n" if session.total_duration else "  总耗时: 未知\n",
+            f"  成功率: {session.success_rate:.1f}%\n\n",
+        ]
+
+        # 配置信息
+        if session.serial_config:
+            parts.append("串口配置:\n")
+            parts.extend(f"  {key}: {value}\n"
+                         for key, value in session.serial_config.items())
+            parts.append("\n")
+
+        if session.standard_values:
+            parts.append("标准值配置:\n")
+            parts.extend(f"  {key}: {value}\n"
+                         for key, value in session.standard_values.items())
+            parts.append("\n")
+
+        # 步骤详情（每步骤预格式化为一个多行字符串）
+        parts.append("步骤执行详情:\n")
+        parts.append("-" * 60 + "\n")
+        for i, step in enumerate(session.steps, 1):
+            block = (
+                f"{i}. {step.step_name} ({step.step_id})\n"
+                f"   DI码: {step.di_code}\n"
+                f"   状态: {step.status}\n"
+            )
+            block += (f"   执行时间: {step.execution_time:.2f}秒\n"
+                      if step.execution_time else "   执行时间: 未知\n")
+            if step.correction_value is not None:
+                block += f"   校正值: {step.correction_value:+.2f}%\n"
+            if step.error_message:
+                block += f"   错误信息: {step.error_message}\n"
+            parts.append(block + "\n")
+
+        # 备注
+        if session.notes:
+            parts.append("备注信息:\n")
+            parts.append(session.notes)
+            parts.append("\n\n")
+
+        parts.append("=" * 60 + "\n")
+        parts.append(f"报告生成时间: {datetime.now().isoformat()}\n")
+
+        with open(export_file, 'w', encoding='utf-8') as f:
+            f.write(''.join(parts))
 
         return str(export_file)
 
@@ -482,7 +838,9 @@ class SessionRecorder:
         """导出为CSV格式"""
         export_file = export_dir / f"{session.session_id}_steps.csv"
 
-        with open(export_file, 'w', newline='', encoding='utf-8-sig') as f:
+        # 大缓冲减少写syscall次数；writerows走csv模块C层紧循环
+        with open(export_file, 'w', newline='', encoding='utf-8-sig',
+                  buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # CSV标题行
@@ -492,28 +850,25 @@ class SessionRecorder:
             ])
 
             # 步骤数据
-            for step in session.steps:
-                writer.writerow([
-                    step.step_id,
-                    step.step_name,
-                    step.di_code,
-                    step.start_time,
-                    step.end_time or '',
-                    step.status,
-                    step.correction_value or '',
-                    step.execution_time or '',
-                    step.error_message or ''
-                ])
+            writer.writerows(
+                (step.step_id,
+                 step.step_name,
+                 step.di_code,
+                 step.start_time,
+                 step.end_time or '',
+                 step.status,
+                 step.correction_value if step.correction_value is not None else '',
+                 step.execution_time if step.execution_time is not None else '',
+                 step.error_message or '')
+                for step in session.steps
+            )
 
         return str(export_file)
 
     def _export_to_json(self, session: CalibrationSession, export_dir: Path) -> str:
         """导出为JSON格式"""
         export_file = export_dir / f"{session.session_id}_data.json"
-
-        with open(export_file, 'w', encoding='utf-8') as f:
-            json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
-
+        export_file.write_bytes(_dumps_json(session.to_dict()))
         return str(export_file)
 
     def get_statistics(self, date_range: Optional[tuple] = None) -> Dict[str, Any]:
@@ -528,15 +883,16 @@ class SessionRecorder:
         try:
             sessions = self.get_recent_sessions(limit=100)  # 获取更多数据进行统计
 
-            # 过滤日期范围
+            # 过滤日期范围：ISO-8601字典序即时间序，
+            # 直接比较日期前缀，免去每会话一次datetime解析
             if date_range:
                 start_date, end_date = date_range
-                filtered_sessions = []
-                for session in sessions:
-                    session_date = datetime.fromisoformat(session['start_time']).date()
-                    if start_date <= session_date <= end_date:
-                        filtered_sessions.append(session)
-                sessions = filtered_sessions
+                start_str = start_date.isoformat()
+                end_str = end_date.isoformat()
+                sessions = [
+                    session for session in sessions
+                    if start_str <= session['start_time'][:10] <= end_str
+                ]
 
             if not sessions:
                 return {
@@ -4,21 +4,46 @@
 串口配置对话框
 """
 
+import time
+
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QComboBox, QSpinBox, QPushButton,
     QGroupBox, QDialogButtonBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
 from core.serial_port import SerialConfig, SerialPort
 
 
+class _PortScanTask(QRunnable):
+    """后台串口枚举任务
+
+    平台枚举（Windows WMI / Linux sysfs）可能耗时数百毫秒，
+    放线程池执行避免阻塞UI线程
+    """
+
+    class Signals(QObject):
+        ready = pyqtSignal(list)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = self.Signals()
+
+    def run(self):
+        self.signals.ready.emit(SerialPort().get_available_ports())
+
+
 class SerialConfigDialog(QDialog):
     """串口配置对话框"""
 
+    # 端口枚举结果缓存时间（秒），短时间重复点刷新直接复用
+    PORTS_CACHE_TTL = 2.0
+
     def __init__(self, parent=None, current_config=None):
         super().__init__(parent)
         self.config = current_config or SerialConfig()
+        self._ports_cache = (0.0, [])
+        self._scan_pending = False
         self.setup_ui()
         self.load_config()
 
@@ -44,29 +69,32 @@ class SerialConfigDialog(QDialog):
         refresh_btn.clicked.connect(self.refresh_ports)
         basic_layout.addWidget(refresh_btn, 0, 2)
 
-        # 波特率
+        # 波特率（数值存userData，读取时免字符串解析）
         basic_layout.addWidget(QLabel("波特率:"), 1, 0)
         self.baudrate_combo = QComboBox()
-        self.baudrate_combo.addItems(["2400", "4800", "9600", "19200", "38400"])
-        self.baudrate_combo.setEditable(True)
+        for baudrate in (2400, 4800, 9600, 19200, 38400):
+            self.baudrate_combo.addItem(str(baudrate), baudrate)
         basic_layout.addWidget(self.baudrate_combo, 1, 1)
 
         # 数据位
         basic_layout.addWidget(QLabel("数据位:"), 2, 0)
         self.bytesize_combo = QComboBox()
-        self.bytesize_combo.addItems(["7", "8"])
+        for bytesize in (7, 8):
+            self.bytesize_combo.addItem(str(bytesize), bytesize)
         basic_layout.addWidget(self.bytesize_combo, 2, 1)
 
-        # 校验位
+        # 校验位（pyserial的单字符代码直接作userData）
         basic_layout.addWidget(QLabel("校验位:"), 3, 0)
         self.parity_combo = QComboBox()
-        self.parity_combo.addItems(["None", "Even", "Odd"])
+        for label, code in (("None", 'N'), ("Even", 'E'), ("Odd", 'O')):
+            self.parity_combo.addItem(label, code)
         basic_layout.addWidget(self.parity_combo, 3, 1)
 
         # 停止位
         basic_layout.addWidget(QLabel("停止位:"), 4, 0)
         self.stopbits_combo = QComboBox()
-        self.stopbits_combo.addItems(["1", "2"])
+        for stopbits in (1, 2):
+            self.stopbits_combo.addItem(str(stopbits), stopbits)
         basic_layout.addWidget(self.stopbits_combo, 4, 1)
 
         layout.addWidget(basic_group)
@@ -114,11 +142,29 @@ class SerialConfigDialog(QDialog):
         layout.addWidget(buttons)
 
     def refresh_ports(self):
-        """刷新端口列表"""
-        sp = SerialPort()
-        ports = sp.get_available_ports()
-
-        current_port = self.port_combo.currentText()
+        """刷新端口列表（结果缓存，枚举在线程池后台执行）"""
+        cached_at, ports = self._ports_cache
+        if time.monotonic() - cached_at < self.PORTS_CACHE_TTL:
+            self._populate_ports(ports)
+            return
+
+        if self._scan_pending:
+            return
+        self._scan_pending = True
+
+        task = _PortScanTask()
+        task.signals.ready.connect(self._on_ports_ready)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_ports_ready(self, ports):
+        """后台枚举完成，更新缓存并填充下拉框"""
+        self._scan_pending = False
+        self._ports_cache = (time.monotonic(), ports)
+        self._populate_ports(ports)
+
+    def _populate_ports(self, ports):
+        """填充端口下拉框，尽量保持当前选择"""
+        current_port = self.port_combo.currentText() or self.config.port
         self.port_combo.clear()
         self.port_combo.addItems(ports)
 
@@ -126,16 +172,22 @@ class SerialConfigDialog(QDialog):
         if current_port in ports:
             self.port_combo.setCurrentText(current_port)
 
+    @staticmethod
+    def _select_data(combo, value):
+        """按userData选中下拉项，值不在预设列表时追加一项"""
+        index = combo.findData(value)
+        if index < 0:
+            combo.addItem(str(value), value)
+            index = combo.count() - 1
+        combo.setCurrentIndex(index)
+
     def load_config(self):
         """加载配置到界面"""
         self.port_combo.setCurrentText(self.config.port)
-        self.baudrate_combo.setCurrentText(str(self.config.baudrate))
-        self.bytesize_combo.setCurrentText(str(self.config.bytesize))
-
-        parity_map = {'N': 'None', 'E': 'Even', 'O': 'Odd'}
-        self.parity_combo.setCurrentText(parity_map.get(self.config.parity, 'None'))
-
-        self.stopbits_combo.setCurrentText(str(self.config.stopbits))
+        self._select_data(self.baudrate_combo, self.config.baudrate)
+        self._select_data(self.bytesize_combo, self.config.bytesize)
+        self._select_data(self.parity_combo, self.config.parity)
+        self._select_data(self.stopbits_combo, self.config.stopbits)
         self.timeout_spin.setValue(int(self.config.timeout * 1000))
         self.write_timeout_spin.setValue(int(self.config.write_timeout * 1000))
         self.retry_spin.setValue(self.config.retry_count)
@@ -145,13 +197,10 @@ class SerialConfigDialog(QDialog):
         """获取配置"""
         config = SerialConfig()
         config.port = self.port_combo.currentText()
-        config.baudrate = int(self.baudrate_combo.currentText())
-        config.bytesize = int(self.bytesize_combo.currentText())
-
-        parity_map = {'None': 'N', 'Even': 'E', 'Odd': 'O'}
-        config.parity = parity_map.get(self.parity_combo.currentText(), 'N')
-
-        config.stopbits = int(self.stopbits_combo.currentText())
+        config.baudrate = self.baudrate_combo.currentData()
+        config.bytesize = self.bytesize_combo.currentData()
+        config.parity = self.parity_combo.currentData()
+        config.stopbits = self.stopbits_combo.currentData()
         config.timeout = self.timeout_spin.value() / 1000.0
         config.write_timeout = self.write_timeout_spin.value() / 1000.0
         config.retry_count = self.retry_spin.value()
@@ -9,32 +9,57 @@ from PyQt5.QtWidgets import (
     QLabel, QDoubleSpinBox, QCheckBox, QPushButton,
     QGroupBox, QDialogButtonBox, QMessageBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker
 from PyQt5.QtGui import QFont
 
 
+# 静态错误文案（校验热路径只引用，不重复构造字符串）
+_ERRORS = (
+    "标准电压必须在90-300V范围内",
+    "标准电流必须在0-200A范围内",
+    "功率误差必须在±10%范围内",
+)
+
+
+def _validate(voltage, current, power_error, out=None):
+    """对三个标准值做纯函数范围校验，返回(是否有效, 错误列表)
+
+    信号热路径直接以spinbox数值调用，免去临时配置对象的构造；
+    传入out可复用同一列表，避免每次校验新建
+    """
+    if out is None:
+        errors = []
+    else:
+        errors = out
+        errors.clear()
+    if not (90.0 <= voltage <= 300.0):
+        errors.append(_ERRORS[0])
+    if not (0.0 <= current <= 200.0):
+        errors.append(_ERRORS[1])
+    if not (-10.0 <= power_error <= 10.0):
+        errors.append(_ERRORS[2])
+    return not errors, errors
+
+
 class StandardValuesConfig:
     """标准值配置类"""
+
+    __slots__ = ('standard_voltage', 'standard_current',
+                 'power_error', 'error_mode_enabled',
+                 'frequency', 'phase_angle')
+
     def __init__(self):
         self.standard_voltage = 220.0      # 标准电压(V)
         self.standard_current = 64.0       # 标准电流(A)
         self.power_error = 0.0            # 功率误差(%)
         self.error_mode_enabled = False    # 误差校准模式
+        self.frequency = None              # 工频(Hz)，None表示未指定
+        self.phase_angle = None            # 相位角(°)，None表示未指定
 
     def is_valid(self):
         """验证配置有效性"""
-        errors = []
-
-        if not (90 <= self.standard_voltage <= 300):
-            errors.append("标准电压必须在90-300V范围内")
-
-        if not (0 <= self.standard_current <= 200):
-            errors.append("标准电流必须在0-200A范围内")
-
-        if not (-10 <= self.power_error <= 10):
-            errors.append("功率误差必须在±10%范围内")
-
-        return len(errors) == 0, errors
+        return _validate(self.standard_voltage, self.standard_current,
+                         self.power_error)
 
     def to_dict(self):
         """转换为字典"""
@@ -46,10 +71,15 @@ class StandardValuesConfig:
         }
 
     def from_dict(self, data):
-        """从字典加载"""
-        for key, value in data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        """从字典加载（显式字段赋值，未知键直接忽略）"""
+        self.standard_voltage = float(
+            data.get('standard_voltage', self.standard_voltage))
+        self.standard_current = float(
+            data.get('standard_current', self.standard_current))
+        self.power_error = float(
+            data.get('power_error', self.power_error))
+        self.error_mode_enabled = bool(
+            data.get('error_mode_enabled', self.error_mode_enabled))
 
     def get_summary(self):
         """获取摘要字符串"""
@@ -62,9 +92,19 @@ class StandardValuesConfig:
 class StandardValuesDialog(QDialog):
     """标准值输入对话框"""
 
+    # 输入校验去抖间隔（毫秒）：连续滚轮/按住方向键只校验最终值
+    VALIDATE_DEBOUNCE_MS = 50
+
     def __init__(self, parent=None, current_config=None):
         super().__init__(parent)
         self.config = current_config or StandardValuesConfig()
+
+        # 单次触发定时器合并密集的valueChanged信号
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(self.VALIDATE_DEBOUNCE_MS)
+        self._validate_timer.timeout.connect(self._do_validate)
+
         self.setup_ui()
         self.load_config()
 
@@ -113,7 +153,9 @@ class StandardValuesDialog(QDialog):
         error_layout = QVBoxLayout(error_group)
 
         self.error_mode_check = QCheckBox("启用误差校准模式")
-        self.error_mode_check.toggled.connect(self.on_error_mode_toggled)
+        # QueuedConnection规避PyQt5 5.15下toggled的双重发射
+        self.error_mode_check.toggled.connect(
+            self.on_error_mode_toggled, Qt.QueuedConnection)
         error_layout.addWidget(self.error_mode_check)
 
         # 功率误差输入
@@ -152,6 +194,13 @@ class StandardValuesDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+        # 上次校验的输入与展示状态，输入未变或状态未迁移时跳过控件更新
+        self._last_validation_key = None
+        self._label_text = None
+        self._label_shown = False
+        self._ok_enabled = True
+        self._err_buf = []
+
         # 初始状态
         self.on_error_mode_toggled(False)
 
@@ -159,34 +208,67 @@ class StandardValuesDialog(QDialog):
         """误差模式切换"""
         self.power_error_spin.setEnabled(enabled)
         if not enabled:
+            # 阻断valueChanged，归零不再触发第二轮校验
+            blocker = QSignalBlocker(self.power_error_spin)
             self.power_error_spin.setValue(0.0)
+            del blocker
+        self.validate_values()
+
+    def validate_values(self, *_):
+        """调度一次去抖校验（密集编辑只对最终值执行）"""
+        self._validate_timer.start()
 
-    def validate_values(self):
+    def _do_validate(self):
         """验证输入值"""
-        temp_config = StandardValuesConfig()
-        temp_config.standard_voltage = self.voltage_spin.value()
-        temp_config.standard_current = self.current_spin.value()
-        temp_config.power_error = self.power_error_spin.value()
-        temp_config.error_mode_enabled = self.error_mode_check.isChecked()
+        key = (
+            self.voltage_spin.value(),
+            self.current_spin.value(),
+            self.power_error_spin.value()
+        )
+        # 输入组合与上次一致（如滚轮来回）直接跳过
+        if key == self._last_validation_key:
+            return
+        self._last_validation_key = key
 
-        is_valid, errors = temp_config.is_valid()
+        is_valid, errors = _validate(*key, out=self._err_buf)
 
+        # 只在展示状态实际迁移时才触碰控件，避免无谓的样式/重绘
         if is_valid:
-            self.validation_label.hide()
-            self.ok_button.setEnabled(True)
+            if self._label_shown:
+                self.validation_label.hide()
+                self._label_shown = False
         else:
-            self.validation_label.setText("\\n".join(errors))
-            self.validation_label.show()
-            self.ok_button.setEnabled(False)
+            text = "\n".join(errors)
+            if text != self._label_text:
+                self.validation_label.setText(text)
+                self._label_text = text
+            if not self._label_shown:
+                self.validation_label.show()
+                self._label_shown = True
+
+        if is_valid != self._ok_enabled:
+            self.ok_button.setEnabled(is_valid)
+            self._ok_enabled = is_valid
 
     def load_config(self):
-        """加载配置到界面"""
+        """加载配置到界面
+
+        四个setter都会发射change信号，QSignalBlocker作用域内
+        整体静默，最后只做一次校验
+        """
+        blockers = [QSignalBlocker(w) for w in (
+            self.voltage_spin, self.current_spin,
+            self.power_error_spin, self.error_mode_check)]
         self.voltage_spin.setValue(self.config.standard_voltage)
         self.current_spin.setValue(self.config.standard_current)
         self.power_error_spin.setValue(self.config.power_error)
         self.error_mode_check.setChecked(self.config.error_mode_enabled)
+        self.power_error_spin.setEnabled(self.config.error_mode_enabled)
+        del blockers
 
-        self.validate_values()
+        # 初始状态立即校验，不等去抖窗口；并取消此前排队的去抖触发
+        self._validate_timer.stop()
+        self._do_validate()
 
     def get_config(self):
         """获取配置"""
@@ -204,7 +286,7 @@ class StandardValuesDialog(QDialog):
         is_valid, errors = config.is_valid()
 
         if not is_valid:
-            QMessageBox.warning(self, "输入错误", "\\n".join(errors))
+            QMessageBox.warning(self, "输入错误", "\n".join(errors))
             return
 
         super().accept()
\ No newline at end of file
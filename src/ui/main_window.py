@@ -11,57 +11,100 @@ from PyQt5.QtWidgets import (
     QTextEdit, QToolBar, QMenuBar, QStatusBar, QAction,
     QFrame, QGridLayout, QSizePolicy, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QThread, pyqtSlot
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer, QThread, pyqtSlot
 from PyQt5.QtGui import QFont, QIcon, QPixmap, QPainter, QColor
 
-# M3校表执行引擎
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import time
+import logging
+from collections import deque
+from contextlib import contextmanager
 
+# M3校表执行引擎（src目录由入口脚本统一加入sys.path，模块内
+# 不再重复改写全局导入路径，避免同一模块经两条路径重复加载）
 from core.calibration_step import CalibrationParameters, StepStatus
-from core.calibration_executor import CalibrationExecutor, ExecutionConfig, ExecutionMode
-from core.device_communicator import DeviceCommunicator, CommunicationConfig
-from core.parameter_calculator import ParameterCalculator
+
+# 步骤ID到名称/数字编号的映射（进度回调热路径只查表，不再
+# 每次重建字典或做字符串替换加int解析）
+_STEP_NAMES = {
+    "step1": "电流有效值offset校正",
+    "step2": "电压电流增益校正",
+    "step3": "功率增益校正",
+    "step4": "相位补偿校正",
+    "step5": "小电流偏置校正"
+}
+_STEP_ID_TO_NUM = {step_id: int(step_id[4:]) for step_id in _STEP_NAMES}
+
+# 步骤结果状态图标；颜色由步骤面板统一的QSS按state属性匹配
+_RESULT_ICONS = {
+    "success": "✓",
+    "error": "✗",
+    "running": "⟳",
+}
+_DEFAULT_RESULT_ICON = "●"
 
 
 class StatusIndicator(QLabel):
     """状态指示灯控件"""
+
+    _COLOR_MAP = {
+        "green": QColor(0, 255, 0),
+        "gray": QColor(128, 128, 128),
+        "yellow": QColor(255, 255, 0),
+        "red": QColor(255, 0, 0)
+    }
+
+    # 按(尺寸, 颜色)缓存画好的圆点，同色状态切换只做setPixmap
+    _PIXMAP_CACHE = {}
+
     def __init__(self, size=16):
         super().__init__()
         self.size = size
         self.setFixedSize(size, size)
+        self._ensure_cache(size)
         self.set_status("gray")  # 默认灰色
 
-    def set_status(self, color):
-        """设置状态颜色: green/gray/yellow/red"""
-        pixmap = QPixmap(self.size, self.size)
-        pixmap.fill(Qt.transparent)
-
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
+    @classmethod
+    def _ensure_cache(cls, size):
+        """为指定尺寸预画四色圆点（每个进程每种尺寸只画一次）"""
+        if (size, "gray") in cls._PIXMAP_CACHE:
+            return
+        for color, qcolor in cls._COLOR_MAP.items():
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
 
-        color_map = {
-            "green": QColor(0, 255, 0),
-            "gray": QColor(128, 128, 128),
-            "yellow": QColor(255, 255, 0),
-            "red": QColor(255, 0, 0)
-        }
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(qcolor)
+            painter.drawEllipse(2, 2, size-4, size-4)
+            painter.end()
 
-        painter.setBrush(color_map.get(color, QColor(128, 128, 128)))
-        painter.drawEllipse(2, 2, self.size-4, self.size-4)
-        painter.end()
+            cls._PIXMAP_CACHE[(size, color)] = pixmap
 
-        self.setPixmap(pixmap)
+    @pyqtSlot(str)
+    def set_status(self, color):
+        """设置状态颜色: green/gray/yellow/red"""
+        cache = self._PIXMAP_CACHE
+        self.setPixmap(cache.get((self.size, color),
+                                 cache[(self.size, "gray")]))
 
 
 class CalibrationStepWidget(QWidget):
     """校表步骤控件"""
     step_triggered = pyqtSignal(int)  # 步骤执行信号
 
+    # 整个步骤面板共用的样式表：挂在父容器上只解析一次，
+    # 结果标签颜色按state动态属性匹配
+    QSS = (
+        'QLabel#resultLabel { color: gray; font-size: 12px; }\n'
+        'QLabel#resultLabel[state="success"] { color: green; }\n'
+        'QLabel#resultLabel[state="error"] { color: red; }\n'
+        'QLabel#resultLabel[state="running"] { color: blue; }'
+    )
+
     def __init__(self, step_id, step_name, step_description):
         super().__init__()
         self.step_id = step_id
+        self.string_id = f"step{step_id}"  # 执行引擎用的字符串ID
         self.step_name = step_name
         self.step_description = step_description
         self.setup_ui()
@@ -80,14 +123,15 @@ class CalibrationStepWidget(QWidget):
         top_layout.addStretch()
 
         self.exec_button = QPushButton("执行此步")
-        self.exec_button.clicked.connect(lambda: self.step_triggered.emit(self.step_id))
+        self.exec_button.clicked.connect(self._emit_triggered)
         top_layout.addWidget(self.exec_button)
 
         layout.addLayout(top_layout)
 
         # 第二行：结果显示区域
         self.result_label = QLabel("等待执行...")
-        self.result_label.setStyleSheet("color: gray; font-size: 12px;")
+        self.result_label.setObjectName("resultLabel")
+        self._result_state = ""
         layout.addWidget(self.result_label)
 
         # 分割线
@@ -96,29 +140,76 @@ class CalibrationStepWidget(QWidget):
         line.setFrameShadow(QFrame.Sunken)
         layout.addWidget(line)
 
+    @pyqtSlot()
+    def _emit_triggered(self):
+        """执行按钮点击转发为带步骤ID的step_triggered信号"""
+        self.step_triggered.emit(self.step_id)
+
     def set_result(self, status, message, elapsed_time=None):
         """设置步骤结果"""
-        if status == "success":
-            icon = "✓"
-            color = "green"
-        elif status == "error":
-            icon = "✗"
-            color = "red"
-        elif status == "running":
-            icon = "⟳"
-            color = "blue"
-        else:
-            icon = "●"
-            color = "gray"
+        icon = _RESULT_ICONS.get(status, _DEFAULT_RESULT_ICON)
+        state = status if status in _RESULT_ICONS else ""
 
         time_str = f" ({elapsed_time}ms)" if elapsed_time else ""
         self.result_label.setText(f"{icon} {message}{time_str}")
-        self.result_label.setStyleSheet(f"color: {color}; font-size: 12px;")
+
+        # 状态未变化时不触发样式重新匹配
+        if state != self._result_state:
+            self._result_state = state
+            self.result_label.setProperty("state", state)
+            style = self.result_label.style()
+            style.unpolish(self.result_label)
+            style.polish(self.result_label)
+
+
+class CalibrationWorker(QObject):
+    """校表执行工作对象
+
+    随QThread运行，把阻塞的串口I/O移出GUI线程；
+    结果与异常通过信号回到主线程处理
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, executor, step_ids, params, single_step=False):
+        super().__init__()
+        self._executor = executor
+        self._step_ids = step_ids
+        self._params = params
+        self._single_step = single_step
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            if self._single_step:
+                result = self._executor.execute_single_step(
+                    self._step_ids[0], self._params)
+            else:
+                result = self._executor.execute_selected_steps(
+                    self._step_ids, self._params)
+            self.finished.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 
 class MainWindow(QMainWindow):
     """主窗口类"""
 
+    # 跨线程进度信号：worker线程发射，经队列连接回GUI线程更新控件
+    step_progress = pyqtSignal(str, object, object)
+
+    # 跨线程日志信号：日志处理器在串口线程发射，队列投递回GUI线程
+    log_signal = pyqtSignal(str)
+
+    # 日志合并刷新间隔（毫秒）
+    LOG_FLUSH_MS = 30
+
+    # 端口枚举结果缓存时间（秒）
+    PORTS_CACHE_TTL = 2.0
+
+    # 日志等宽字体共享实例（须在QApplication创建后构造，故懒加载）
+    _LOG_FONT = None
+
     def __init__(self):
         super().__init__()
 
@@ -129,12 +220,28 @@ class MainWindow(QMainWindow):
         self.standard_values = None  # 标准值配置
         self.serial_port = None  # 串口对象
 
+        self.standard_values_config = None  # 标准值对话框配置
+
         # M3校表执行引擎组件
         self.calibration_executor = None
         self.device_communicator = None
-        self.parameter_calculator = ParameterCalculator()
+        self._log_handler_installed = False
+        self._parameter_calculator = None  # 首次访问时再导入构造
         self.calibration_params = CalibrationParameters()  # 默认校表参数
 
+        # 后台校表线程（执行期间非None，同时用作重入判断）
+        self._calib_thread = None
+        self._calib_worker = None
+
+        # 日志合并缓冲：add_log只入队，定时器到期一次性刷入文本框；
+        # 上限与文本框块数上限一致，面板隐藏期间积攒也不会无界
+        self._log_buffer = deque(maxlen=5000)
+        self._log_timer_pending = False
+        self._log_verbosity = logging.INFO
+
+        # 端口枚举结果缓存（时间戳, 列表），TTL内重复查询免扫描
+        self._ports_cache = (0.0, [])
+
         self.setup_ui()
         self.setup_menus()
         self.setup_toolbar()
@@ -165,10 +272,13 @@ class MainWindow(QMainWindow):
 
         # 设置分割比例 (40% : 60%)
         splitter.setSizes([400, 600])
+        self._splitter = splitter
 
     def setup_steps_panel(self, parent):
         """设置左侧步骤面板"""
         steps_group = QGroupBox("校表步骤")
+        # 五个步骤控件共用一份样式表，整组只解析一次
+        steps_group.setStyleSheet(CalibrationStepWidget.QSS)
         steps_layout = QVBoxLayout(steps_group)
 
         # 五大校表步骤
@@ -195,11 +305,17 @@ class MainWindow(QMainWindow):
         log_group = QGroupBox("通信日志")
         log_layout = QVBoxLayout(log_group)
 
-        # 日志文本区域
+        # 日志文本区域（等宽字体实例类级共享：QFont构造要查字体
+        # 数据库做替换解析，多窗口复用同一份即可）
+        if MainWindow._LOG_FONT is None:
+            MainWindow._LOG_FONT = QFont("Consolas", 9)
         self.log_text = QTextEdit()
-        self.log_text.setFont(QFont("Consolas", 9))  # 等宽字体
+        self.log_text.setFont(MainWindow._LOG_FONT)
         self.log_text.setReadOnly(True)
         self.log_text.setPlaceholderText("通信日志将在此显示...\n格式: Tx> / Rx> + 十六进制帧数据")
+        # 限制日志块数量，超出后Qt以O(1)丢弃最旧行，长会话内存与
+        # 追加耗时保持有界
+        self.log_text.document().setMaximumBlockCount(5000)
         log_layout.addWidget(self.log_text)
 
         parent.addWidget(log_group)
@@ -317,11 +433,16 @@ class MainWindow(QMainWindow):
 
     def connect_signals(self):
         """连接信号槽"""
-        # 这里将在后续实现具体的信号连接
-        pass
+        # 校表进度由worker线程发射，跨线程自动走队列连接回GUI线程
+        self.step_progress.connect(self._on_step_progress)
+        # 日志转发显式走队列连接，任意线程emit都安全
+        self.log_signal.connect(self.add_log, Qt.QueuedConnection)
+        # 日志面板从折叠恢复时补刷积攒的日志
+        self._splitter.splitterMoved.connect(self._on_splitter_moved)
 
     # ================ 槽函数 ================
 
+    @pyqtSlot(int)
     def on_step_execute(self, step_id):
         """执行单个步骤"""
         step_name = self.step_widgets[step_id].step_name
@@ -341,30 +462,23 @@ class MainWindow(QMainWindow):
             self.add_log(f"!!! {step_name} 执行失败: 串口未连接")
             return
 
-        try:
-            # 更新校表参数
-            self._update_calibration_params_from_standard_values()
-
-            # 数字ID转换为步骤字符串ID
-            step_string_id = f"step{step_id}"
-
-            # 使用M3校表执行引擎执行步骤
-            step_result = self.calibration_executor.execute_single_step(
-                step_string_id,
-                self.calibration_params
-            )
-
-            # 结果已通过进度回调处理，这里不需要额外操作
-
-        except Exception as e:
-            step_widget = self.step_widgets[step_id]
-            step_widget.set_result("error", f"执行异常: {str(e)}", 0)
-            self.add_log(f"!!! {step_name} 执行异常: {str(e)}")
+        # 串口I/O交给后台线程，结果经进度信号回到GUI线程处理
+        self._start_calibration([self.step_widgets[step_id].string_id],
+                                single_step=True)
 
 
 
+    @pyqtSlot()
     def on_one_click_calibration(self):
-        """一键校表"""
+        """一键校表（执行期间再次点击请求取消）"""
+        # 执行中按钮充当取消入口：置stop_requested让执行器在
+        # 当前步骤边界协作式停下，无需强杀线程
+        if self._calib_thread is not None:
+            if self.calibration_executor:
+                self.calibration_executor.cancel_execution()
+            self.add_log(">>> 已请求取消校表，将在当前步骤结束后停止")
+            return
+
         # 检查校表执行引擎是否可用
         if not self.calibration_executor:
             self.add_log("!!! 一键校表失败: 校表引擎未初始化")
@@ -375,51 +489,98 @@ class MainWindow(QMainWindow):
             self.add_log("!!! 一键校表失败: 串口未连接")
             return
 
-        # 检查选中的步骤
-        checked_steps = [
-            step_id for step_id, widget in self.step_widgets.items()
+        # 检查选中的步骤（字符串ID控件创建时已备好，这里只收集）
+        step_string_ids = [
+            widget.string_id
+            for step_id, widget in sorted(self.step_widgets.items())
             if widget.checkbox.isChecked()
         ]
 
-        if not checked_steps:
+        if not step_string_ids:
             self.add_log("!!! 未选择任何步骤")
             return
 
-        try:
-            # 更新校表参数
-            self._update_calibration_params_from_standard_values()
-
-            # 转换为步骤字符串ID列表
-            step_string_ids = [f"step{step_id}" for step_id in sorted(checked_steps)]
+        self.add_log(f">>> 开始一键校表，步骤: {step_string_ids}")
+        self._start_calibration(step_string_ids)
 
-            self.add_log(f">>> 开始一键校表，步骤: {step_string_ids}")
+    def _start_calibration(self, step_ids, single_step=False):
+        """在后台QThread上启动校表执行
 
-            # 使用M3校表执行引擎执行选择的步骤
-            execution_result = self.calibration_executor.execute_selected_steps(
-                step_string_ids,
-                self.calibration_params
-            )
+        执行引擎内部是阻塞式串口收发，放worker线程跑，
+        GUI线程只通过信号收进度与结果；执行期间禁用一键
+        校表按钮防止重入
+        """
+        if self._calib_thread is not None:
+            self.add_log("!!! 已有校表任务在执行中")
+            return
 
-            # 显示执行结果摘要
-            if execution_result.status.value == "completed":
-                success_count = len(execution_result.successful_steps)
-                total_count = len(execution_result.executed_steps)
-                self.add_log(f">>> 一键校表完成: {success_count}/{total_count} 步骤成功")
-            else:
-                self.add_log(f"!!! 一键校表异常: {execution_result.error_message}")
+        # 更新校表参数
+        self._update_calibration_params_from_standard_values()
+
+        self._calib_thread = QThread(self)
+        self._calib_worker = CalibrationWorker(
+            self.calibration_executor, step_ids,
+            self.calibration_params, single_step)
+        self._calib_worker.moveToThread(self._calib_thread)
+        self._calib_thread.started.connect(self._calib_worker.run)
+        self._calib_worker.finished.connect(self._on_calibration_finished)
+        self._calib_worker.failed.connect(self._on_calibration_failed)
+
+        self.one_click_button.setText("取消校表")
+        self._calib_thread.start()
+
+    @contextmanager
+    def _batch_ui(self):
+        """批量更新控件期间暂停重绘，退出时合并成一次repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _finish_calibration_thread(self):
+        """回收校表线程并恢复按钮状态（GUI线程）"""
+        thread, worker = self._calib_thread, self._calib_worker
+        self._calib_thread = None
+        self._calib_worker = None
+        if thread is not None:
+            thread.quit()
+            thread.wait(2000)
+            thread.deleteLater()
+        if worker is not None:
+            worker.deleteLater()
+        self.one_click_button.setText("一键校表")
+
+    @pyqtSlot(object)
+    def _on_calibration_finished(self, result):
+        """校表任务完成（GUI线程）
+
+        单步结果已由进度信号逐条处理；批量执行这里补一条摘要
+        """
+        with self._batch_ui():
+            if hasattr(result, 'executed_steps'):
+                if result.status.value == "completed":
+                    success_count = len(result.successful_steps)
+                    total_count = len(result.executed_steps)
+                    self.add_log(f">>> 一键校表完成: {success_count}/{total_count} 步骤成功")
+                else:
+                    self.add_log(f"!!! 一键校表异常: {result.error_message}")
+            self._finish_calibration_thread()
 
-        except Exception as e:
-            self.add_log(f"!!! 一键校表异常: {str(e)}")
+    @pyqtSlot(str)
+    def _on_calibration_failed(self, message):
+        """校表任务抛出异常（GUI线程）"""
+        self.add_log(f"!!! 校表执行异常: {message}")
+        self._finish_calibration_thread()
 
+    @pyqtSlot()
     def on_serial_toggle(self):
         """串口开关"""
         if self.serial_toggle_button.text() == "开始串口":
             # 检查是否有串口配置，如果没有则自动打开配置对话框
-            config_is_default = (not hasattr(self, 'serial_config') or
-                                not self.serial_config or
-                                not hasattr(self.serial_config, 'port') or
-                                not self.serial_config.port or
-                                self.serial_config.port == "COM1")  # 默认端口
+            config_is_default = (not self.serial_config.port or
+                                 self.serial_config.port == "COM1")  # 默认端口
 
             if config_is_default:
                 self.add_log(">>> 首次使用，请配置串口参数...")
@@ -431,9 +592,7 @@ class MainWindow(QMainWindow):
                 # 创建带默认值的配置
                 default_config = SerialConfig()
                 # 尝试设置第一个可用端口作为默认值
-                from core.serial_port import SerialPort
-                sp = SerialPort()
-                ports = sp.get_available_ports()
+                ports = self._available_ports()
                 if ports:
                     default_config.port = ports[0]
 
@@ -493,24 +652,44 @@ class MainWindow(QMainWindow):
             self.status_indicator.set_status("gray")
             self.serial_status_label.setText("串口: 未连接")
 
+    def _available_ports(self):
+        """返回可用串口列表（带TTL缓存）
+
+        平台枚举（Windows注册表/WMI、POSIX扫/dev）单次就要几十
+        毫秒，短时间内的重复查询直接复用上次结果
+        """
+        cached_at, ports = self._ports_cache
+        if time.monotonic() - cached_at < self.PORTS_CACHE_TTL:
+            return ports
+
+        from core.serial_port import SerialPort
+        ports = SerialPort().get_available_ports()
+        self._ports_cache = (time.monotonic(), ports)
+        return ports
+
+    @pyqtSlot()
     def on_refresh_ports(self):
         """刷新端口"""
         self.add_log(">>> 正在刷新串口列表...")
+        # 失效缓存，下次查询强制重新枚举
+        self._ports_cache = (0.0, [])
 
+    @pyqtSlot()
     def on_load_template(self):
         """载入模板"""
         self.add_log(">>> 载入Excel模板")
 
+    @pyqtSlot()
     def on_export_records(self):
         """导出记录"""
         self.add_log(">>> 导出校表记录")
 
+    @pyqtSlot()
     def on_serial_config(self):
         """串口配置"""
         from .dialogs.serial_config_dialog import SerialConfigDialog
 
-        # 获取当前串口配置（如果有的话）
-        current_config = getattr(self, 'serial_config', None)
+        current_config = self.serial_config
 
         dialog = SerialConfigDialog(self, current_config)
         if dialog.exec_() == SerialConfigDialog.Accepted:
@@ -522,12 +701,10 @@ class MainWindow(QMainWindow):
         else:
             self.add_log(">>> 串口配置取消")
 
+    @pyqtSlot()
     def on_port_detect(self):
         """端口探测"""
-        from core.serial_port import SerialPort
-
-        sp = SerialPort()
-        ports = sp.get_available_ports()
+        ports = self._available_ports()
 
         if ports:
             ports_str = ", ".join(ports)
@@ -535,39 +712,45 @@ class MainWindow(QMainWindow):
         else:
             self.add_log(">>> 未发现可用串口")
 
+    @pyqtSlot()
     def on_standard_values(self):
         """标准值输入"""
         from .dialogs.standard_values_dialog import StandardValuesDialog
 
-        # 获取当前标准值配置（如果有的话）
-        current_config = getattr(self, 'standard_values_config', None)
+        current_config = self.standard_values_config
 
         dialog = StandardValuesDialog(self, current_config)
         if dialog.exec_() == StandardValuesDialog.Accepted:
             self.standard_values_config = dialog.get_config()
-            self.add_log(f">>> 标准值已更新: {self.standard_values_config.get_summary()}")
 
-            # 更新状态栏显示
-            self.standard_values_label.setText(f"标准值: {self.standard_values_config.get_summary()}")
+            # 摘要格式化一次，日志与状态栏共用
+            summary = self.standard_values_config.get_summary()
+            self.add_log(f">>> 标准值已更新: {summary}")
+            self.standard_values_label.setText(f"标准值: {summary}")
         else:
             self.add_log(">>> 标准值输入取消")
 
+    @pyqtSlot()
     def on_engineer_params(self):
         """工程师参数"""
         self.add_log(">>> 打开工程师参数对话框")
 
+    @pyqtSlot()
     def on_step_template(self):
         """步骤模板管理"""
         self.add_log(">>> 步骤模板管理")
 
+    @pyqtSlot()
     def on_exec_strategy(self):
         """执行策略"""
         self.add_log(">>> 执行策略配置")
 
+    @pyqtSlot()
     def on_usage_help(self):
         """使用说明"""
         self.add_log(">>> 显示使用说明")
 
+    @pyqtSlot()
     def on_about(self):
         """关于"""
         from PyQt5.QtWidgets import QMessageBox
@@ -576,19 +759,78 @@ class MainWindow(QMainWindow):
                          "基于PyQt5的单页版校准工具\\n"
                          "支持DL/T645协议和一键校表")
 
-    def add_log(self, message):
-        """添加日志"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        self.log_text.append(f"[{timestamp}] {message}")
+    def add_log(self, message, level=logging.INFO):
+        """添加日志（先入缓冲，30ms定时合并刷入文本框）
+
+        DeviceCommunicator在单个步骤内可能连发几十条Tx/Rx记录，
+        逐条append每次都触发一轮文档重排与重绘；合并后每个刷新
+        周期只排版一次。低于当前详细级别的消息直接丢弃；日志
+        面板被折叠时普通消息只积攒不排版，面板恢复后一次补刷
+        """
+        if level < self._log_verbosity:
+            return
 
-        # 自动滚动到底部
+        # 整数纳秒拆秒/毫秒，避开datetime对象构造与浮点取模误差
+        ns = time.time_ns()
+        timestamp = time.strftime("%H:%M:%S", time.localtime(ns // 1_000_000_000))
+        millis = (ns // 1_000_000) % 1000
+        self._log_buffer.append(f"[{timestamp}.{millis:03d}] {message}")
+
+        if not self._log_timer_pending and (
+                self.log_text.isVisible() or level >= logging.WARNING):
+            self._log_timer_pending = True
+            QTimer.singleShot(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _on_splitter_moved(self, *_):
+        """分割条移动后，若日志面板重新可见则补刷积攒的日志"""
+        if (self._log_buffer and not self._log_timer_pending
+                and self.log_text.isVisible()):
+            self._log_timer_pending = True
+            QTimer.singleShot(self.LOG_FLUSH_MS, self._flush_log)
+
+    def showEvent(self, event):
+        """窗口显示时把启动期积攒的日志刷入文本框"""
+        super().showEvent(event)
+        if self._log_buffer and not self._log_timer_pending:
+            self._log_timer_pending = True
+            QTimer.singleShot(self.LOG_FLUSH_MS, self._flush_log)
+
+    def _flush_log(self):
+        """把缓冲的日志行一次性追加到文本框"""
+        self._log_timer_pending = False
+        if not self._log_buffer:
+            return
+
+        batch = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+
+        # 仅当用户本就停在底部时才跟随滚动，翻看历史时不强制拉回
         scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        follow = scrollbar.value() == scrollbar.maximum()
+
+        self.log_text.append(batch)
 
+        if follow:
+            scrollbar.setValue(scrollbar.maximum())
+
+
+    @property
+    def parameter_calculator(self):
+        """参数计算器（懒加载，窗口启动不为其付导入开销）"""
+        if self._parameter_calculator is None:
+            from core.parameter_calculator import ParameterCalculator
+            self._parameter_calculator = ParameterCalculator()
+        return self._parameter_calculator
 
     def _initialize_calibration_engine(self):
         """初始化M3校表执行引擎"""
+        # 执行引擎及其传递依赖（serial等）推迟到首次打开串口时
+        # 加载，缩短窗口首绘；模块缓存保证重复初始化不重复导入
+        from core.calibration_executor import (
+            CalibrationExecutor, ExecutionConfig, ExecutionMode)
+        from core.device_communicator import (
+            DeviceCommunicator, CommunicationConfig)
+
         try:
             self.add_log(">>> 正在初始化校表执行引擎...")
 
@@ -611,7 +853,7 @@ class MainWindow(QMainWindow):
                 stop_on_error=False,
                 auto_retry_failed=True,
                 max_step_retries=2,
-                progress_callback=self._on_step_progress
+                progress_callback=self.step_progress.emit
             )
 
             # 创建校表执行器
@@ -640,12 +882,13 @@ class MainWindow(QMainWindow):
 
         self.add_log(">>> 校表执行引擎已清理")
 
+    @pyqtSlot(str, object, object)
     def _on_step_progress(self, step_id: str, status: StepStatus, result):
         """步骤进度回调"""
         step_name = self._get_step_name_from_id(step_id)
 
         # 转换字符串步骤ID为数字ID (step1 -> 1)
-        numeric_step_id = int(step_id.replace("step", "")) if step_id.startswith("step") else None
+        numeric_step_id = _STEP_ID_TO_NUM.get(step_id)
 
         if status == StepStatus.RUNNING:
             self.add_log(f">>> 正在执行步骤: {step_name}")
@@ -653,42 +896,45 @@ class MainWindow(QMainWindow):
                 self.step_widgets[numeric_step_id].set_result("running", "正在执行...")
 
         elif status == StepStatus.SUCCESS:
+            # 结果标签与日志连续更新，合并为一次重绘；RUNNING分支
+            # 保持即时刷新给用户进行中反馈
             correction_value = result.correction_value if result else 0.0
-            self.add_log(f">>> 步骤执行成功: {step_name}, 校正值: {correction_value:+.2f}")
-            if numeric_step_id and numeric_step_id in self.step_widgets:
-                execution_time = int(result.execution_time * 1000) if result and result.execution_time else 0
-                self.step_widgets[numeric_step_id].set_result("success", f"校正成功 ({correction_value:+.2f}%)", execution_time)
+            with self._batch_ui():
+                self.add_log(f">>> 步骤执行成功: {step_name}, 校正值: {correction_value:+.2f}")
+                if numeric_step_id and numeric_step_id in self.step_widgets:
+                    execution_time = int(result.execution_time * 1000) if result and result.execution_time else 0
+                    self.step_widgets[numeric_step_id].set_result("success", f"校正成功 ({correction_value:+.2f}%)", execution_time)
 
         elif status == StepStatus.FAILED:
             error_msg = result.error_message if result else "执行失败"
-            self.add_log(f"!!! 步骤执行失败: {step_name}, 错误: {error_msg}")
-            if numeric_step_id and numeric_step_id in self.step_widgets:
-                self.step_widgets[numeric_step_id].set_result("error", f"执行失败: {error_msg}", 0)
+            with self._batch_ui():
+                self.add_log(f"!!! 步骤执行失败: {step_name}, 错误: {error_msg}")
+                if numeric_step_id and numeric_step_id in self.step_widgets:
+                    self.step_widgets[numeric_step_id].set_result("error", f"执行失败: {error_msg}", 0)
 
     def _get_step_name_from_id(self, step_id: str) -> str:
         """根据步骤ID获取步骤名称"""
-        step_names = {
-            "step1": "电流有效值offset校正",
-            "step2": "电压电流增益校正",
-            "step3": "功率增益校正",
-            "step4": "相位补偿校正",
-            "step5": "小电流偏置校正"
-        }
-        return step_names.get(step_id, f"步骤{step_id}")
+        return _STEP_NAMES.get(step_id, f"步骤{step_id}")
 
     def _update_calibration_params_from_standard_values(self):
         """从标准值配置更新校表参数"""
-        if hasattr(self, 'standard_values_config') and self.standard_values_config:
-            self.calibration_params.standard_voltage = self.standard_values_config.standard_voltage
-            self.calibration_params.standard_current = self.standard_values_config.standard_current
-            if hasattr(self.standard_values_config, 'frequency'):
-                self.calibration_params.frequency = self.standard_values_config.frequency
-            if hasattr(self.standard_values_config, 'phase_angle'):
-                self.calibration_params.phase_angle = self.standard_values_config.phase_angle
+        config = self.standard_values_config
+        if config is not None:
+            self.calibration_params.standard_voltage = config.standard_voltage
+            self.calibration_params.standard_current = config.standard_current
+            if config.frequency is not None:
+                self.calibration_params.frequency = config.frequency
+            if config.phase_angle is not None:
+                self.calibration_params.phase_angle = config.phase_angle
 
     def _setup_communicator_logging(self):
-        """设置通信器日志转发到主窗口"""
-        import logging
+        """设置通信器日志转发到主窗口
+
+        处理器整个进程只装一次：串口反复开关时若每次都
+        addHandler，同一条记录会被分发N份
+        """
+        if self._log_handler_installed:
+            return
 
         class MainWindowLogHandler(logging.Handler):
             def __init__(self, main_window):
@@ -697,12 +943,10 @@ class MainWindow(QMainWindow):
 
             def emit(self, record):
                 try:
-                    message = self.format(record)
-                    # 在主线程中添加日志
-                    if hasattr(self.main_window, 'add_log'):
-                        self.main_window.add_log(message)
+                    # 经信号投递回GUI线程，串口线程里emit同样安全
+                    self.main_window.log_signal.emit(self.format(record))
                 except Exception:
-                    pass
+                    self.handleError(record)
 
         # 为设备通信器和相关组件添加日志处理器
         handler = MainWindowLogHandler(self)
@@ -713,6 +957,8 @@ class MainWindow(QMainWindow):
         communicator_logger.addHandler(handler)
         communicator_logger.setLevel(logging.INFO)
 
+        self._log_handler_installed = True
+
 
 def main():
     """测试主窗口"""
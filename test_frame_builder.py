@@ -5,27 +5,41 @@ M2阶段：FrameBuilder单元测试
 验证FrameBuilder算法与Excel模板的100%等价性
 """
 
+import logging
 import unittest
 import sys
 import os
 
+import numpy as np
+
 # 添加src路径到sys.path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from core.frame_builder import ExcelEquivalentFrameBuilder, create_excel_equivalent_frame
 
+# 测试过程输出走logging.debug：默认静默，不在pytest捕获路径上
+# 逐行刷stdout；%惰性格式化只在handler启用时才真正拼串。
+# 需要看详情时 logging.basicConfig(level=logging.DEBUG) 即可
+logger = logging.getLogger(__name__)
+
 class TestFrameBuilderEquivalence(unittest.TestCase):
     """FrameBuilder Excel等价性测试"""
 
-    def setUp(self):
-        """测试初始化"""
-        self.builder = ExcelEquivalentFrameBuilder()
+    @classmethod
+    def setUpClass(cls):
+        """类级测试初始化：常量数据只解析一次，9个用例共用
+
+        构建器无可变状态，共享单实例即可，免去每个用例重建
+        """
         # Excel中B32的实际结果
-        self.excel_frame = "6811111111111168140D33482B33333333333433333333FC16"
+        cls.excel_frame_bytes = bytes.fromhex(
+            "6811111111111168140D33482B33333333333433333333FC16")
+        cls.excel_frame = cls.excel_frame_bytes.hex().upper()
+        cls.builder = ExcelEquivalentFrameBuilder()
 
     def test_di_reverse_function(self):
         """测试DI字节序翻转功能"""
-        print("\n=== 测试DI字节序翻转 ===")
+        logger.debug("=== 测试DI字节序翻转 ===")
 
         test_cases = [
             ("00F81500", "00 15 F8 00"),  # Excel中的示例
@@ -40,11 +54,11 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
                 result = self.builder.reverse_di_bytes(original)
                 self.assertEqual(result, expected,
                     f"DI翻转失败: {original} -> {result}, 期望: {expected}")
-                print(f"✓ {original} -> {result}")
+                logger.debug("di翻转 %s -> %s", original, result)
 
     def test_data_offset_function(self):
         """测试0x33偏置功能"""
-        print("\n=== 测试0x33偏置 ===")
+        logger.debug("=== 测试0x33偏置 ===")
 
         test_cases = [
             ([0x00, 0x15, 0xF8, 0x00], [0x33, 0x48, 0x2B, 0x33]),  # Excel示例
@@ -59,11 +73,11 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
                 result = self.builder.apply_data_offset(original)
                 self.assertEqual(result, expected,
                     f"偏置计算失败: {original} -> {result}, 期望: {expected}")
-                print(f"✓ {[f'{b:02X}' for b in original]} -> {[f'{b:02X}' for b in result]}")
+                logger.debug("偏置 %s -> %s", original, result)
 
     def test_excel_field_conversion(self):
         """测试Excel字段转换"""
-        print("\n=== 测试Excel字段转换 ===")
+        logger.debug("=== 测试Excel字段转换 ===")
 
         test_cases = [
             ("33333333", [0x00, 0x00, 0x00, 0x00]),  # 密码域
@@ -76,38 +90,37 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
                 result = self.builder.convert_excel_field_to_bytes(field_str)
                 self.assertEqual(result, expected,
                     f"字段转换失败: {field_str} -> {result}, 期望: {expected}")
-                print(f"✓ '{field_str}' -> {[f'{b:02X}' for b in result]}")
+                logger.debug("字段转换 %r -> %s", field_str, result)
 
     def test_checksum_calculation(self):
         """测试校验和计算"""
-        print("\n=== 测试校验和计算 ===")
+        logger.debug("=== 测试校验和计算 ===")
 
         # 使用Excel帧测试校验和
-        excel_frame_bytes = bytes.fromhex(self.excel_frame.replace(' ', ''))
-        frame_without_checksum = excel_frame_bytes[:-2]  # 去掉校验和和结束符
+        frame_without_checksum = self.excel_frame_bytes[:-2]  # 去掉校验和和结束符
 
         calculated_checksum = self.builder.calculate_checksum(frame_without_checksum, start_pos=0)
         expected_checksum = 0xFC
 
         self.assertEqual(calculated_checksum, expected_checksum,
             f"校验和计算失败: 计算得{calculated_checksum:02X}, 期望{expected_checksum:02X}")
-        print(f"✓ 校验和计算正确: {calculated_checksum:02X}")
+        logger.debug("校验和计算正确: %02X", calculated_checksum)
 
     def test_complete_frame_generation(self):
         """测试完整帧生成"""
-        print("\n=== 测试完整帧生成 ===")
+        logger.debug("=== 测试完整帧生成 ===")
 
         # 使用Excel中的默认参数生成帧
         generated_frame = self.builder.build_frame_excel_equivalent()
-        generated_hex = ''.join(f'{b:02X}' for b in generated_frame)
+        generated_hex = bytes(generated_frame).hex().upper()
 
         self.assertEqual(generated_hex, self.excel_frame,
             f"完整帧生成失败:\n生成: {generated_hex}\nExcel: {self.excel_frame}")
-        print(f"✓ 完整帧生成正确: {len(generated_frame)}字节")
+        logger.debug("完整帧生成正确: %d字节", len(generated_frame))
 
     def test_frame_validation_function(self):
         """测试帧验证功能"""
-        print("\n=== 测试帧验证功能 ===")
+        logger.debug("=== 测试帧验证功能 ===")
 
         # 正确的帧
         correct_frame = self.builder.build_frame_excel_equivalent()
@@ -115,20 +128,20 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
 
         self.assertTrue(validation_result['is_match'], "正确帧验证失败")
         self.assertEqual(validation_result['generated_len'], validation_result['expected_len'])
-        print(f"✓ 正确帧验证通过")
+        logger.debug("正确帧验证通过")
 
-        # 错误的帧（修改一个字节）
-        wrong_frame = bytearray(correct_frame)
-        wrong_frame[0] = 0x69  # 修改起始符
-        validation_result = self.builder.validate_against_excel(bytes(wrong_frame), self.excel_frame)
+        # 错误的帧（起始符改坏，一次拼接构造，免去bytearray往返拷贝）
+        wrong_frame = b'\x69' + correct_frame[1:]
+        validation_result = self.builder.validate_against_excel(wrong_frame, self.excel_frame)
 
         self.assertFalse(validation_result['is_match'], "错误帧应该验证失败")
         self.assertGreater(len(validation_result['differences']), 0, "应该有差异记录")
-        print(f"✓ 错误帧验证正确失败，发现{len(validation_result['differences'])}个差异")
+        logger.debug("错误帧验证正确失败，发现%d个差异",
+                     len(validation_result['differences']))
 
     def test_different_di_codes(self):
         """测试不同DI码的帧生成"""
-        print("\n=== 测试不同DI码 ===")
+        logger.debug("=== 测试不同DI码 ===")
 
         test_di_codes = [
             "00F81600",  # 不同的DI码
@@ -137,22 +150,30 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
             "00F81900",
         ]
 
-        for di_code in test_di_codes:
-            with self.subTest(di_code=di_code):
-                frame = self.builder.build_frame_excel_equivalent(di_code=di_code)
-                frame_hex = ''.join(f'{b:02X}' for b in frame)
-
-                # 验证帧结构正确性
-                self.assertEqual(frame[0], 0x68, "起始符错误")
-                self.assertEqual(frame[7], 0x68, "第二个起始符错误")
-                self.assertEqual(frame[8], 0x14, "控制码错误")
-                self.assertEqual(frame[-1], 0x16, "结束符错误")
-
-                print(f"✓ DI {di_code}: {len(frame)}字节帧")
+        frames = np.stack([
+            np.frombuffer(
+                self.builder.build_frame_excel_equivalent(di_code=di_code),
+                dtype=np.uint8)
+            for di_code in test_di_codes
+        ])
+
+        # 帧结构批量校验：两次向量化比较替代逐帧逐字段assertEqual，
+        # 失败时numpy的数组diff输出能直接看到哪帧哪列不符
+        expected_header = np.tile(
+            np.array([0x68, 0x68, 0x14], dtype=np.uint8),
+            (len(test_di_codes), 1))
+        np.testing.assert_array_equal(
+            frames[:, [0, 7, 8]], expected_header,
+            err_msg="起始符/控制码结构错误")
+        np.testing.assert_array_equal(
+            frames[:, -1], 0x16, err_msg="结束符错误")
+
+        for di_code, frame in zip(test_di_codes, frames):
+            logger.debug("DI %s: %d字节帧", di_code, len(frame))
 
     def test_parameter_data_handling(self):
         """测试参数数据处理"""
-        print("\n=== 测试参数数据处理 ===")
+        logger.debug("=== 测试参数数据处理 ===")
 
         test_cases = [
             (b"", "无参数数据"),
@@ -174,18 +195,18 @@ class TestFrameBuilderEquivalence(unittest.TestCase):
                 self.assertEqual(actual_data_len, expected_data_len,
                     f"数据长度错误: 期望{expected_data_len}, 实际{actual_data_len}")
 
-                print(f"✓ {description}: 数据长度{actual_data_len}")
+                logger.debug("%s: 数据长度%d", description, actual_data_len)
 
     def test_convenience_function(self):
         """测试便捷函数"""
-        print("\n=== 测试便捷函数 ===")
+        logger.debug("=== 测试便捷函数 ===")
 
         # 测试工厂函数
         frame1 = create_excel_equivalent_frame()
         frame2 = self.builder.build_frame_excel_equivalent()
 
         self.assertEqual(frame1, frame2, "便捷函数与类方法结果不一致")
-        print(f"✓ 便捷函数工作正常")
+        logger.debug("便捷函数工作正常")
 
 
 class TestFrameBuilderEdgeCases(unittest.TestCase):
@@ -196,7 +217,7 @@ class TestFrameBuilderEdgeCases(unittest.TestCase):
 
     def test_invalid_di_code(self):
         """测试无效DI码"""
-        print("\n=== 测试无效DI码 ===")
+        logger.debug("=== 测试无效DI码 ===")
 
         invalid_di_codes = [
             "12345",      # 长度不对
@@ -208,11 +229,11 @@ class TestFrameBuilderEdgeCases(unittest.TestCase):
             with self.subTest(di_code=di_code):
                 with self.assertRaises(ValueError, msg=f"应该抛出ValueError: {di_code}"):
                     self.builder.reverse_di_bytes(di_code)
-                print(f"✓ 正确拒绝无效DI: {di_code}")
+                logger.debug("正确拒绝无效DI: %s", di_code)
 
     def test_large_parameter_data(self):
         """测试大量参数数据"""
-        print("\n=== 测试大参数数据 ===")
+        logger.debug("=== 测试大参数数据 ===")
 
         large_data = b"\x00" * 100  # 100字节数据
         frame = self.builder.build_frame_excel_equivalent(parameter_data=large_data)
@@ -226,7 +247,8 @@ class TestFrameBuilderEdgeCases(unittest.TestCase):
         actual_len = frame[9]
         self.assertEqual(actual_len, expected_len, "大数据长度计算错误")
 
-        print(f"✓ 大参数数据处理正常: {len(large_data)}字节 -> {len(frame)}字节帧")
+        logger.debug("大参数数据处理正常: %d字节 -> %d字节帧",
+                     len(large_data), len(frame))
 
 
 def run_all_tests():
@@ -54,7 +54,7 @@ def test_m3_components():
 
         # 生成测试帧
         frame = builder.build_frame_excel_equivalent("00F81500", b"")
-        frame_hex = ''.join(f'{b:02X}' for b in frame)
+        frame_hex = bytes(frame).hex().upper()
         print(f"   ✓ 生成帧: {frame_hex}")
 
         # 解析测试
@@ -8,9 +8,17 @@ M4可维护性优化集成测试
 import sys
 import os
 import tempfile
-import shutil
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# 整个模块共用一个临时根目录：各测试只建自己的子目录，
+# 退出时一次性递归清理，免去每个测试mkdtemp+rmtree的文件系统开销
+_TMP_ROOT = tempfile.TemporaryDirectory(prefix="m4_test_")
+
+
+def _test_dir(name):
+    """在共享临时根目录下为单个测试创建独立子目录"""
+    return tempfile.mkdtemp(prefix=name + "_", dir=_TMP_ROOT.name)
+
 def test_config_manager():
     """测试配置管理器"""
     print("1. 测试配置管理器...")
@@ -19,7 +27,7 @@ def test_config_manager():
         from core.config_manager import ConfigManager, AppConfig
 
         # 创建临时配置目录
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = _test_dir("config")
         config_manager = ConfigManager(temp_dir)
 
         # 测试基本功能
@@ -39,8 +47,6 @@ def test_config_manager():
         backups = config_manager.get_backup_list()
         print(f"   ✓ 备份数量: {len(backups)}")
 
-        # 清理
-        shutil.rmtree(temp_dir)
         return True
 
     except Exception as e:
@@ -94,7 +100,7 @@ def test_session_recorder():
         from core.session_recorder import SessionRecorder
 
         # 创建临时记录目录
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = _test_dir("records")
         recorder = SessionRecorder(temp_dir)
 
         # 开始会话
@@ -132,8 +138,6 @@ def test_session_recorder():
         stats = recorder.get_statistics()
         print(f"   ✓ 统计信息: {stats.get('total_sessions', 0)}个会话, 成功率{stats.get('average_success_rate', 0):.1f}%")
 
-        # 清理
-        shutil.rmtree(temp_dir)
         return True
 
     except Exception as e:
@@ -183,7 +187,7 @@ def test_parameter_presets():
         from core.parameter_presets import ParameterPresets
 
         # 创建临时预设目录
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = _test_dir("presets")
         presets_manager = ParameterPresets(temp_dir)
 
         # 获取内置预设
@@ -213,8 +217,6 @@ def test_parameter_presets():
         summary = presets_manager.get_preset_summary()
         print(f"   ✓ 预设摘要: 总数{summary['total_presets']}, 内置{summary['builtin_presets']}, 用户{summary['user_presets']}")
 
-        # 清理
-        shutil.rmtree(temp_dir)
         return True
 
     except Exception as e:
@@ -227,7 +229,7 @@ def test_integration_scenario():
 
     try:
         # 创建临时目录
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = _test_dir("integration")
 
         # 1. 配置管理 + 预设系统
         from core.config_manager import ConfigManager
@@ -273,8 +275,6 @@ def test_integration_scenario():
         device_summary = device_manager.get_device_summary()
         print(f"   ✓ 设备管理集成: {device_summary['total_devices']}个设备")
 
-        # 清理
-        shutil.rmtree(temp_dir)
         return True
 
     except Exception as e: